@@ -1,61 +1,9 @@
+import os
 import sys
 import traceback
 
 from src.core import Settings, configure_logging, ensure_directory, get_pdf_files
-from src.features.anonymization import (
-    PIIRedactor,
-    RedactionValidator,
-    UUIDMappingService,
-    build_default_registry,
-)
-from src.features.metadata import (
-    AgeExtractor,
-    BMIExtractor,
-    FindingsExtractor,
-    GestationalAgeExtractor,
-    MetadataExtractor,
-)
-from src.features.ocr import OCREngine, load_ocr_config
-from src.features.output import JSONSerializer, PDFGenerator
-from src.pipeline import (
-    AnonymizationStage,
-    ETLPipeline,
-    ExtractionStage,
-    OCRStage,
-    OutputStage,
-)
-
-
-def build_pipeline(settings: Settings) -> ETLPipeline:
-    ocr_config = load_ocr_config(settings)
-    ocr_engine = OCREngine(ocr_config)
-
-    registry = build_default_registry()
-    patterns = registry.get_all()
-    redactor = PIIRedactor(patterns)
-    validator = RedactionValidator(patterns)
-
-    extractor = MetadataExtractor(
-        [
-            GestationalAgeExtractor(),
-            AgeExtractor(),
-            BMIExtractor(),
-            FindingsExtractor(),
-        ]
-    )
-
-    pdf_generator = PDFGenerator()
-    uuid_service = UUIDMappingService(settings.id_map_file)
-    json_serializer = JSONSerializer()
-
-    stages = [
-        OCRStage(ocr_engine),
-        AnonymizationStage(redactor, validator),
-        ExtractionStage(extractor),
-        OutputStage(pdf_generator, uuid_service, settings.output_dir),
-    ]
-
-    return ETLPipeline(stages, json_serializer)
+from src.pipeline import build_pipeline, factory
 
 
 def main() -> int:
@@ -69,13 +17,21 @@ def main() -> int:
 
     logger.info("Processing %s PDF files", len(pdf_files))
     pipeline = build_pipeline(settings)
-    
-    if settings.max_workers > 1:
-        logger.info(f"Running in parallel mode with {settings.max_workers} workers")
-        results = pipeline.run_batch_parallel(pdf_files, settings.json_output, settings.max_workers)
-    else:
-        logger.info("Running in sequential mode")
-        results = pipeline.run_batch(pdf_files, settings.json_output)
+    if settings.max_workers > 1 or settings.ocr_concurrency > 1:
+        # One Tesseract thread per process or page; parallelism comes from the
+        # worker pool or the concurrent pages, and OpenMP would oversubscribe
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+    try:
+        if settings.max_workers > 1:
+            logger.info(f"Running in parallel mode with {settings.max_workers} workers")
+            results = pipeline.run_batch_parallel(pdf_files, settings.json_output, settings.max_workers)
+        else:
+            logger.info("Running in sequential mode")
+            results = pipeline.run_batch(pdf_files, settings.json_output)
+    finally:
+        # The shared redactor and extractor memoize document text; drop them
+        factory.reset()
 
     successes = sum(1 for item in results if not item.has_errors())
     failures = len(results) - successes
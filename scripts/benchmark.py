@@ -1,4 +1,5 @@
 import argparse
+import os
 import sys
 import time
 from pathlib import Path
@@ -8,59 +9,7 @@ project_root = Path(__file__).resolve().parent.parent
 sys.path.append(str(project_root))
 
 from src.core import Settings, configure_logging, get_pdf_files
-from src.features.ocr import OCREngine, load_ocr_config
-from src.features.anonymization import (
-    PIIRedactor,
-    RedactionValidator,
-    UUIDMappingService,
-    build_default_registry,
-)
-from src.features.metadata import (
-    AgeExtractor,
-    BMIExtractor,
-    FindingsExtractor,
-    GestationalAgeExtractor,
-    MetadataExtractor,
-)
-from src.features.output import PDFGenerator, JSONSerializer
-from src.pipeline import (
-    AnonymizationStage,
-    ETLPipeline,
-    ExtractionStage,
-    OCRStage,
-    OutputStage,
-)
-
-def build_pipeline(settings: Settings) -> ETLPipeline:
-    ocr_config = load_ocr_config(settings)
-    ocr_engine = OCREngine(ocr_config)
-
-    registry = build_default_registry()
-    patterns = registry.get_all()
-    redactor = PIIRedactor(patterns)
-    validator = RedactionValidator(patterns)
-
-    extractor = MetadataExtractor(
-        [
-            GestationalAgeExtractor(),
-            AgeExtractor(),
-            BMIExtractor(),
-            FindingsExtractor(),
-        ]
-    )
-
-    pdf_generator = PDFGenerator()
-    uuid_service = UUIDMappingService(settings.id_map_file)
-    json_serializer = JSONSerializer()
-
-    stages = [
-        OCRStage(ocr_engine),
-        AnonymizationStage(redactor, validator),
-        ExtractionStage(extractor),
-        OutputStage(pdf_generator, uuid_service, settings.output_dir),
-    ]
-
-    return ETLPipeline(stages, json_serializer)
+from src.pipeline import build_pipeline
 
 def run_benchmark(limit: int = None, parallel: bool = False, workers: int = None):
     settings = Settings.load()
@@ -82,15 +31,18 @@ def run_benchmark(limit: int = None, parallel: bool = False, workers: int = None
     print(f"Processing {len(pdf_files)} files...")
     pipeline = build_pipeline(settings)
     
+    # Intended configuration: single-threaded Tesseract (OMP_THREAD_LIMIT=1)
+    # with one worker or page thread per core. Export a different limit to
+    # measure against it.
+    if parallel or settings.ocr_concurrency > 1:
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
     start_time = time.time()
     
     if parallel:
-        if hasattr(pipeline, 'run_batch_parallel'):
-            print(f"Running in PARALLEL mode with {workers} workers...")
-            results = pipeline.run_batch_parallel(pdf_files, settings.json_output, max_workers=workers)
-        else:
-            print("Error: run_batch_parallel not implemented yet.")
-            return
+        workers = workers or settings.max_workers
+        print(f"Running in PARALLEL mode with {workers} workers...")
+        results = pipeline.run_batch_parallel(pdf_files, settings.json_output, max_workers=workers)
     else:
         print("Running in SEQUENTIAL mode...")
         results = pipeline.run_batch(pdf_files, settings.json_output)
@@ -1,5 +1,4 @@
-import warnings
-
+from src.core.utils import warn_once
 from src.features.anonymization import PIIRedactor, build_default_registry
 
 
@@ -9,9 +8,5 @@ _redactor = PIIRedactor(_registry.get_all())
 
 def anonymize_text(text):
     """Backward-compatible wrapper for PII redaction."""
-    warnings.warn(
-        "anonymize_text is deprecated; use PIIRedactor from src.features.anonymization",
-        DeprecationWarning,
-        stacklevel=2,
-    )
+    warn_once("anonymize_text is deprecated; use PIIRedactor from src.features.anonymization")
     return _redactor.redact(text)
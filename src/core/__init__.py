@@ -6,14 +6,21 @@ from .utils import *
 __all__ = [
     "Settings",
     "configure_logging",
+    "compile_regex",
+    "is_linear_time",
     "retry_on_exception",
+    "retry_on_exception_async",
     "validate_file_exists",
     "validate_pdf",
     "validate_text_not_empty",
     "get_pdf_files",
     "ensure_directory",
+    "atomic_write_bytes",
     "atomic_write_json",
+    "dumps_json",
+    "loads_json",
     "write_lines",
+    "warn_once",
     "ETLException",
     "OCRException",
     "PDFConversionException",
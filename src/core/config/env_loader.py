@@ -1,14 +1,31 @@
 import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
+
+# Parsed files keyed by path; reused while (mtime_ns, size) is unchanged
+_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
 
 
 def load_env_file(path: str) -> Dict[str, str]:
-    """Load simple KEY=VALUE pairs from a .env file."""
-    env_path = Path(path)
-    if not env_path.exists():
+    """Load simple KEY=VALUE pairs from a .env file.
+
+    Parsed results are cached per path and reused until the file's
+    modification time or size changes; callers get a fresh copy.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
         return {}
 
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _CACHE.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, _parse_env_file(Path(path)))
+        _CACHE[path] = cached
+    return dict(cached[1])
+
+
+def _parse_env_file(env_path: Path) -> Dict[str, str]:
     values: Dict[str, str] = {}
     for line in env_path.read_text().splitlines():
         stripped = line.strip()
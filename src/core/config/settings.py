@@ -11,10 +11,16 @@ class Settings:
     tesseract_path: str
     poppler_path: str
     ocr_dpi: int
+    ocr_fallback_dpi: int
     ocr_language: str
+    ocr_concurrency: int
+    ocr_cache_dir: str
+    ocr_text_layer_min_chars: int
+    validate_redaction: bool
     input_dir: str
     output_dir: str
     json_output: str
+    json_layout: str
     id_map_file: str
     log_level: str
     log_file: str
@@ -29,17 +35,27 @@ class Settings:
 
         base_dir = Path(os.getcwd())
         data_dir = base_dir / "data"
+        max_workers = int(os.getenv("MAX_WORKERS", os.cpu_count() or 1))
+        # Page-level OCR threads only pay off when files are processed one at a time
+        default_ocr_concurrency = (os.cpu_count() or 1) if max_workers <= 1 else 1
 
         return cls(
             tesseract_path=os.getenv("TESSERACT_PATH", r"C:\\Program Files\\Tesseract-OCR\\tesseract.exe"),
             poppler_path=os.getenv("POPPLER_PATH", r"C:\\poppler-24.08.0\\Library\\bin"),
-            ocr_dpi=int(os.getenv("OCR_DPI", "300")),
+            ocr_dpi=int(os.getenv("OCR_DPI", "200")),
+            ocr_fallback_dpi=int(os.getenv("OCR_FALLBACK_DPI", "300")),
             ocr_language=os.getenv("OCR_LANGUAGE", "eng"),
+            ocr_concurrency=int(os.getenv("OCR_CONCURRENCY", default_ocr_concurrency)),
+            ocr_cache_dir=os.getenv("OCR_CACHE_DIR", ""),
+            ocr_text_layer_min_chars=int(os.getenv("OCR_TEXT_LAYER_MIN_CHARS", "200")),
+            validate_redaction=os.getenv("VALIDATE_REDACTION", "true").strip().lower()
+            not in ("0", "false", "no", "off"),
             input_dir=os.getenv("INPUT_DIR", str(data_dir / "raw_reports")),
             output_dir=os.getenv("OUTPUT_DIR", str(data_dir / "anonymized_reports")),
             json_output=os.getenv("JSON_OUTPUT", str(data_dir / "patient_metadata.json")),
+            json_layout=os.getenv("JSON_LAYOUT", "records"),
             id_map_file=os.getenv("ID_MAP_FILE", str(data_dir / "id_map.json")),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
             log_file=os.getenv("LOG_FILE", str(base_dir / "logs" / "pipeline.log")),
-            max_workers=int(os.getenv("MAX_WORKERS", os.cpu_count() - 1 or 1)),
+            max_workers=max_workers,
         )
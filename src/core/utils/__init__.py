@@ -1,14 +1,23 @@
-from .retry import retry_on_exception
+from .deprecation import warn_once
+from .regex import compile_regex, is_linear_time
+from .retry import retry_on_exception, retry_on_exception_async
 from .validation import validate_file_exists, validate_pdf, validate_text_not_empty
-from .file_utils import get_pdf_files, ensure_directory, atomic_write_json, write_lines
+from .file_utils import get_pdf_files, ensure_directory, atomic_write_bytes, atomic_write_json, dumps_json, loads_json, write_lines
 
 __all__ = [
+    "compile_regex",
+    "is_linear_time",
     "retry_on_exception",
+    "retry_on_exception_async",
     "validate_file_exists",
     "validate_pdf",
     "validate_text_not_empty",
     "get_pdf_files",
     "ensure_directory",
+    "atomic_write_bytes",
     "atomic_write_json",
+    "dumps_json",
+    "loads_json",
     "write_lines",
+    "warn_once",
 ]
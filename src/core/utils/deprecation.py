@@ -0,0 +1,17 @@
+import warnings
+from typing import Set
+
+_WARNED: Set[str] = set()
+
+
+def warn_once(message: str) -> None:
+    """Emit ``message`` as a DeprecationWarning the first time only.
+
+    Legacy wrappers are called once per document, so warning on every call
+    would repeat the stack walk and filter lookup for a message already shown.
+    The warning is attributed to the wrapper's caller.
+    """
+    if message in _WARNED:
+        return
+    _WARNED.add(message)
+    warnings.warn(message, DeprecationWarning, stacklevel=3)
@@ -1,34 +1,78 @@
+import contextlib
 import json
+import logging
 import os
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Union
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
+
+logger = logging.getLogger("medical_report_etl")
 
 
 def get_pdf_files(directory: str) -> List[str]:
-    return [
-        str(Path(directory) / name)
-        for name in os.listdir(directory)
-        if name.lower().endswith(".pdf")
-    ]
+    # DirEntry caches the file type from the directory read, so no per-file stat
+    with os.scandir(directory) as entries:
+        return [
+            entry.path
+            for entry in entries
+            if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(".pdf")
+        ]
 
 
 def ensure_directory(path: str) -> None:
     Path(path).mkdir(parents=True, exist_ok=True)
 
 
-def atomic_write_json(path: str, payload: object) -> None:
+def atomic_write_json(path: str, payload: object, pretty: bool = False) -> None:
+    """Write JSON atomically; compact unless ``pretty`` asks for indentation."""
+    data = dumps_json(payload, pretty)
+    atomic_write_bytes(path, data)
+    logger.debug("Wrote %s (%d bytes)", path, len(data))
+
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
     import uuid
     # Use a unique temporary file name to avoid collisions between processes
     temp_path = f"{path}.{uuid.uuid4()}.tmp"
-    with open(temp_path, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=4)
+    try:
+        with open(temp_path, "wb") as handle:
+            handle.write(data)
+            # Flushed to disk before the rename, so a crash never leaves a
+            # truncated file under the final name
+            handle.flush()
+            os.fsync(handle.fileno())
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
     # This replace is atomic on POSIX, but on Windows it might fail if destination exists and is open
     # However, standard replace on Windows (Python 3.3+) should be atomic enough for our needs if no one has the file open.
     # The main issue being solved here is multiple writers writing to the SAME temp file.
     os.replace(temp_path, path)
 
 
+def dumps_json(payload: object, pretty: bool = False) -> bytes:
+    """Encode ``payload`` as UTF-8 JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(payload, option=option)
+    if pretty:
+        return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(data: Union[bytes, str]) -> object:
+    """Decode JSON from bytes or text; raises ``ValueError`` on malformed input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def write_lines(path: str, lines: Iterable[str]) -> None:
+    # Joined first so the file gets one write instead of one per line
     with open(path, "w", encoding="utf-8") as handle:
-        for line in lines:
-            handle.write(f"{line}\n")
+        handle.write("".join(f"{line}\n" for line in lines))
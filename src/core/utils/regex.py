@@ -0,0 +1,37 @@
+import re
+from typing import Pattern
+
+try:
+    import re2
+except ImportError:  # optional accelerator
+    re2 = None
+
+
+_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.DOTALL, "s"), (re.MULTILINE, "m"))
+_RE2_FLAGS = re.IGNORECASE | re.DOTALL | re.MULTILINE
+
+
+def compile_regex(pattern: str, flags: int = 0) -> Pattern[str]:
+    """Compile with RE2 when installed, otherwise with the stdlib ``re``.
+
+    RE2 matches in linear time, so noisy OCR text cannot trigger catastrophic
+    backtracking. Patterns RE2 does not support (lookarounds, backreferences)
+    fall back to ``re``.
+    """
+    if re2 is not None and not flags & ~_RE2_FLAGS:
+        inline = "".join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+        try:
+            return re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
+def is_linear_time(pattern: Pattern[str]) -> bool:
+    """Whether ``pattern`` runs on RE2 rather than the backtracking ``re``.
+
+    Fusing many patterns into one alternation only pays off on RE2: ``re``
+    loses its literal-prefix search on an alternation and ends up slower than
+    running the patterns one by one.
+    """
+    return not isinstance(pattern, re.Pattern)
@@ -1,27 +1,87 @@
+import asyncio
+import random
 import time
 from functools import wraps
-from typing import Callable, TypeVar
+from typing import Awaitable, Callable, Iterator, Optional, TypeVar
 
 
 F = TypeVar("F", bound=Callable[..., object])
 
 
-def retry_on_exception(max_attempts: int = 3, backoff_multiplier: int = 2):
-    """Retry decorator with exponential backoff."""
+def retry_on_exception(
+    max_attempts: int = 3,
+    backoff_multiplier: int = 2,
+    initial_delay: float = 1,
+    max_delay: Optional[float] = None,
+    jitter: bool = False,
+    sleep_fn: Optional[Callable[[float], object]] = None,
+):
+    """Retry decorator with exponential backoff.
+
+    Waits ``initial_delay`` seconds after the first failure, multiplied by
+    ``backoff_multiplier`` each time and capped at ``max_delay``. With
+    ``jitter`` each wait is scaled by a random factor in [0.5, 1), so callers
+    that failed together do not retry in lockstep. ``sleep_fn`` replaces
+    ``time.sleep`` (e.g. a no-op in tests).
+    """
 
     def decorator(func: F) -> F:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            delay = 1
+            delays = _backoff_delays(initial_delay, backoff_multiplier, max_delay, jitter)
             for attempt in range(1, max_attempts + 1):
                 try:
                     return func(*args, **kwargs)
                 except Exception:
                     if attempt == max_attempts:
                         raise
-                    time.sleep(delay)
-                    delay *= backoff_multiplier
+                    (sleep_fn or time.sleep)(next(delays))
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def retry_on_exception_async(
+    max_attempts: int = 3,
+    backoff_multiplier: int = 2,
+    initial_delay: float = 1,
+    max_delay: Optional[float] = None,
+    jitter: bool = False,
+    sleep_fn: Optional[Callable[[float], Awaitable[object]]] = None,
+):
+    """Retry decorator for coroutines; backs off with ``asyncio.sleep``.
+
+    The event loop keeps running other work while a failed call waits.
+    Backoff options match ``retry_on_exception``; ``sleep_fn`` must be a
+    coroutine function.
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            delays = _backoff_delays(initial_delay, backoff_multiplier, max_delay, jitter)
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception:
+                    if attempt == max_attempts:
+                        raise
+                    await (sleep_fn or asyncio.sleep)(next(delays))
 
         return wrapper  # type: ignore[return-value]
 
     return decorator
+
+
+def _backoff_delays(
+    initial_delay: float,
+    backoff_multiplier: float,
+    max_delay: Optional[float],
+    jitter: bool,
+) -> Iterator[float]:
+    delay = initial_delay
+    while True:
+        capped = delay if max_delay is None else min(delay, max_delay)
+        yield capped * (0.5 + random.random() * 0.5) if jitter else capped
+        delay *= backoff_multiplier
@@ -7,10 +7,12 @@ def validate_file_exists(path: str) -> None:
 
 
 def validate_pdf(path: str) -> None:
-    if not path.lower().endswith(".pdf"):
+    # Lowercase only the suffix, not the whole path
+    if path[-4:].lower() != ".pdf":
         raise ValueError(f"Expected PDF file: {path}")
 
 
 def validate_text_not_empty(text: str) -> None:
-    if not text or not text.strip():
+    # isspace() scans without copying; strip() would copy the whole text
+    if not text or text.isspace():
         raise ValueError("Extracted text is empty")
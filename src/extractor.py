@@ -1,5 +1,4 @@
-import warnings
-
+from src.core.utils import warn_once
 from src.features.metadata import (
     AgeExtractor,
     BMIExtractor,
@@ -21,9 +20,5 @@ _extractor = MetadataExtractor(
 
 def extract_metadata(text):
     """Backward-compatible wrapper for metadata extraction."""
-    warnings.warn(
-        "extract_metadata is deprecated; use MetadataExtractor from src.features.metadata",
-        DeprecationWarning,
-        stacklevel=2,
-    )
+    warn_once("extract_metadata is deprecated; use MetadataExtractor from src.features.metadata")
     return _extractor.extract_all(text)
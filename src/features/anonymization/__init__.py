@@ -1,4 +1,4 @@
-from .config import AnonymizationConfig
+from .config import AnonymizationConfig, load_anonymization_config
 from .pii_patterns import PIIPattern, PIIPatternRegistry, build_default_registry
 from .redactor import PIIRedactor
 from .uuid_service import UUIDMappingService
@@ -6,6 +6,7 @@ from .validator import RedactionValidator
 
 __all__ = [
     "AnonymizationConfig",
+    "load_anonymization_config",
     "PIIPattern",
     "PIIPatternRegistry",
     "build_default_registry",
@@ -1,6 +1,13 @@
 from dataclasses import dataclass
 
+from src.core.config import Settings
+
 
 @dataclass(frozen=True)
 class AnonymizationConfig:
+    # Re-scan redacted text for leftover PII; off skips a full pass per file
     enable_validation: bool = True
+
+
+def load_anonymization_config(settings: Settings) -> AnonymizationConfig:
+    return AnonymizationConfig(enable_validation=settings.validate_redaction)
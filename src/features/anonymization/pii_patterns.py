@@ -1,5 +1,8 @@
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import cached_property, lru_cache
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+from src.core.utils import compile_regex
 
 
 @dataclass(frozen=True)
@@ -9,50 +12,89 @@ class PIIPattern:
     replacement: str
     priority: int = 0
 
+    @cached_property
+    def compiled(self) -> Pattern[str]:
+        """The regex compiled once per pattern instance."""
+        return compile_regex(self.regex)
+
+    def __getstate__(self) -> Dict:
+        """Exclude the compiled regex from pickling; it is rebuilt on first use."""
+        state = self.__dict__.copy()
+        state.pop("compiled", None)
+        return state
+
 
 class PIIPatternRegistry:
     def __init__(self) -> None:
         self._patterns: Dict[str, PIIPattern] = {}
+        self._sorted: Optional[List[PIIPattern]] = None
 
     def register(self, pattern: PIIPattern) -> None:
         self._patterns[pattern.name] = pattern
+        self._sorted = None
 
     def get_all(self) -> List[PIIPattern]:
-        return sorted(self._patterns.values(), key=lambda p: p.priority)
+        # Sorted once per change; callers get a copy they are free to mutate
+        if self._sorted is None:
+            self._sorted = sorted(self._patterns.values(), key=lambda p: p.priority)
+        return list(self._sorted)
+
+    def build_combined(self) -> Tuple[Pattern[str], Dict[str, str]]:
+        return combine_patterns(self.get_all())
+
+
+def combine_patterns(patterns: Iterable[PIIPattern]) -> Tuple[Pattern[str], Dict[str, str]]:
+    """Fuse patterns into one alternation plus a group-name -> replacement map.
+
+    Alternatives keep the given order, so when two patterns match at the same
+    position the earlier (higher-priority) one wins; ``match.lastgroup``
+    names the pattern that matched. Results are cached per pattern tuple, so
+    redactors and validators over the same patterns share one compile.
+    """
+    combined, replacements = _combine(tuple(patterns))
+    return combined, dict(replacements)
+
+
+@lru_cache(maxsize=32)
+def _combine(patterns: Tuple[PIIPattern, ...]) -> Tuple[Pattern[str], Dict[str, str]]:
+    groups = {f"pii{index}": pattern for index, pattern in enumerate(patterns)}
+    combined = compile_regex(
+        "|".join(f"(?P<{group}>{pattern.regex})" for group, pattern in groups.items())
+    )
+    return combined, {group: pattern.replacement for group, pattern in groups.items()}
+
+
+# Shared by every default registry, so each regex compiles once per process
+DEFAULT_PATTERNS: Tuple[PIIPattern, ...] = (
+    PIIPattern(
+        name="patient_name",
+        regex=r"Patient Name[:\s]+[A-Za-z][A-Za-z \t]+",
+        replacement="Patient Name: [ANONYMIZED]",
+        priority=10,
+    ),
+    PIIPattern(
+        name="patient_id",
+        regex=r"Patient ID[:\s]+[A-Za-z0-9][A-Za-z0-9_-]*",
+        replacement="Patient ID: [ANONYMIZED]",
+        priority=20,
+    ),
+    PIIPattern(
+        name="hospital_name",
+        regex=r"Hospital Name[:\s]+[A-Za-z][A-Za-z \t]+",
+        replacement="Hospital Name: [ANONYMIZED]",
+        priority=30,
+    ),
+    PIIPattern(
+        name="clinician",
+        regex=r"Clinician[:\s]+[A-Za-z][A-Za-z \t]+",
+        replacement="Clinician: [ANONYMIZED]",
+        priority=40,
+    ),
+)
 
 
 def build_default_registry() -> PIIPatternRegistry:
     registry = PIIPatternRegistry()
-    registry.register(
-        PIIPattern(
-            name="patient_name",
-            regex=r"Patient Name[:\s]+[A-Za-z][A-Za-z \t]+",
-            replacement="Patient Name: [ANONYMIZED]",
-            priority=10,
-        )
-    )
-    registry.register(
-        PIIPattern(
-            name="patient_id",
-            regex=r"Patient ID[:\s]+[A-Za-z0-9][A-Za-z0-9_-]*",
-            replacement="Patient ID: [ANONYMIZED]",
-            priority=20,
-        )
-    )
-    registry.register(
-        PIIPattern(
-            name="hospital_name",
-            regex=r"Hospital Name[:\s]+[A-Za-z][A-Za-z \t]+",
-            replacement="Hospital Name: [ANONYMIZED]",
-            priority=30,
-        )
-    )
-    registry.register(
-        PIIPattern(
-            name="clinician",
-            regex=r"Clinician[:\s]+[A-Za-z][A-Za-z \t]+",
-            replacement="Clinician: [ANONYMIZED]",
-            priority=40,
-        )
-    )
+    for pattern in DEFAULT_PATTERNS:
+        registry.register(pattern)
     return registry
@@ -1,22 +1,81 @@
-import re
-from typing import Iterable
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Iterable, Match, Optional, Pattern
 
 from src.core.exceptions import RedactionException
+from src.core.utils import is_linear_time
 
-from .pii_patterns import PIIPattern
+from .pii_patterns import PIIPattern, combine_patterns
 
 
 class PIIRedactor:
-    """Apply a registry of PII patterns to redact text."""
+    """Apply a registry of PII patterns to redact text.
 
-    def __init__(self, patterns: Iterable[PIIPattern]) -> None:
+    Results are memoized by content digest (``cache_size`` entries, 0 to disable).
+    """
+
+    def __init__(self, patterns: Iterable[PIIPattern], cache_size: int = 256) -> None:
         self._patterns = list(patterns)
+        self._combined: Optional[Pattern[str]] = None
+        self._fused: Optional[bool] = None
+        self._replacements: Dict[str, str] = {}
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
 
     def redact(self, text: str) -> str:
+        if not self._patterns:
+            return text
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
         try:
-            redacted = text
-            for pattern in self._patterns:
-                redacted = re.sub(pattern.regex, pattern.replacement, redacted)
-            return redacted
+            redacted = self._scrub(text)
         except Exception as exc:
             raise RedactionException(str(exc)) from exc
+        if self._cache_size > 0:
+            self._cache[key] = redacted
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return redacted
+
+    def compile(self) -> None:
+        """Compile the patterns now instead of on the first ``redact`` call.
+
+        Raises ``RedactionException`` if a pattern is invalid.
+        """
+        if self._fused is not None:
+            return
+        try:
+            combined, replacements = combine_patterns(self._patterns)
+            fused = is_linear_time(combined)
+            if not fused:
+                for pattern in self._patterns:
+                    pattern.compiled  # cached_property; first access compiles
+        except Exception as exc:
+            raise RedactionException(str(exc)) from exc
+        self._replacements = replacements
+        self._combined = combined if fused else None
+        self._fused = fused
+
+    def _scrub(self, text: str) -> str:
+        # Compiled lazily so an invalid pattern surfaces as RedactionException
+        self.compile()
+        if self._fused:
+            return self._combined.sub(self._replace, text)
+        for pattern in self._patterns:
+            replacement = pattern.replacement
+            text = pattern.compiled.sub(lambda _match: replacement, text)
+        return text
+
+    def __getstate__(self) -> Dict:
+        """Exclude the compiled pattern and cache from pickling; workers rebuild lazily."""
+        state = self.__dict__.copy()
+        state["_combined"] = None
+        state["_fused"] = None
+        state["_cache"] = OrderedDict()
+        return state
+
+    def _replace(self, match: Match[str]) -> str:
+        return self._replacements[match.lastgroup]
@@ -1,37 +1,92 @@
-import json
+import logging
+import os
+import uuid
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from filelock import FileLock
 
 from src.core.exceptions import UUIDMappingException
-from src.core.utils import atomic_write_json
+from src.core.utils import atomic_write_bytes, dumps_json, loads_json
 
+logger = logging.getLogger("medical_report_etl")
 
 class UUIDMappingService:
-    """Persist mapping from original IDs to anonymized UUIDs."""
+    """Persist mapping from original IDs to anonymized UUIDs.
+
+    The file is an append-only log of one ``{"original": "uuid"}`` object per line.
+    """
 
     def __init__(self, mapping_file: str) -> None:
         self._mapping_path = Path(mapping_file).resolve()
         # Reuse the same lock object to allow re-entrancy on Windows
         self._lock = FileLock(f"{self._mapping_path}.lock")
         self._mapping: Dict[str, str] = {}
+        self._log_records = 0
+        self._needs_compaction = False
+        self._signature: Optional[Tuple[int, int]] = None
         self._load()
 
     def _load(self) -> None:
         if self._mapping_path.exists():
             # Use lock to prevent reading while another process is replacing the file
             with self._lock:
+                signature = self._file_signature()
+                if signature is not None and signature == self._signature:
+                    return
                 try:
-                    self._mapping = json.loads(self._mapping_path.read_text(encoding="utf-8"))
+                    self._read_log(self._mapping_path.read_bytes())
                 except Exception as exc:
-                    # In case of partial read/write or other issues, try to continue or raise
-                    # If the file is empty or corrupted, we might start fresh? 
-                    # But failing loudly is safer for data integrity.
-                    # However, if concurrent creation happened, it might be fine.
-                    # Let's clean up the raise to be more robust?
-                    # For now just keep existing behavior but with lock.
+                    # Failing loudly is safer for data integrity than starting fresh
                     raise UUIDMappingException(str(exc)) from exc
+                self._signature = signature
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self._mapping_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_log(self, content: bytes) -> None:
+        try:
+            snapshot = loads_json(content) if content.strip() else {}
+        except ValueError:
+            snapshot = None
+
+        if isinstance(snapshot, dict):
+            # A log holding a single record is exactly one newline-terminated
+            # line; anything else (``{}``, a pretty-printed or unterminated
+            # legacy snapshot) must be rewritten before records are appended
+            self._mapping = snapshot
+            self._log_records = len(snapshot)
+            single_record = len(snapshot) == 1 and content.count(b"\n") == 1 and content.endswith(b"\n")
+            self._needs_compaction = not single_record
+            return
+
+        mapping: Dict[str, str] = {}
+        records = 0
+        # An unterminated last line is an append cut short by a crash
+        torn = not content.endswith(b"\n")
+        lines = content.splitlines()
+        for index, line in enumerate(lines):
+            if not line.strip():
+                continue
+            try:
+                record = loads_json(line)
+            except ValueError:
+                if torn and index == len(lines) - 1:
+                    logger.warning("Dropping torn record at the end of %s", self._mapping_path)
+                    break
+                raise
+            if not isinstance(record, dict):
+                raise ValueError(f"Invalid mapping record: {line!r}")
+            mapping.update(record)
+            records += 1
+        self._mapping = mapping
+        self._log_records = records
+        # Rewrite before appending, or the next record would join the torn line
+        self._needs_compaction = torn or records > 2 * len(mapping)
 
     def get_or_create_uuid(self, original_id: str) -> str:
         # Check in-memory first for performance
@@ -49,6 +104,19 @@ class UUIDMappingService:
                 
             return self._create_uuid(original_id)
 
+    def get_or_create_uuids(self, original_ids: Iterable[str]) -> Dict[str, str]:
+        """Resolve many IDs at once; missing ones are created in one locked write."""
+        original_ids = list(original_ids)
+        if all(original_id in self._mapping for original_id in original_ids):
+            return {original_id: self._mapping[original_id] for original_id in original_ids}
+
+        with self._lock:
+            self._load()
+            missing = list(dict.fromkeys(i for i in original_ids if i not in self._mapping))
+            if missing:
+                self._create_uuids(missing)
+            return {original_id: self._mapping[original_id] for original_id in original_ids}
+
     def __getstate__(self) -> Dict:
         """Exclude lock from pickling."""
         state = self.__dict__.copy()
@@ -62,15 +130,46 @@ class UUIDMappingService:
         self._lock = FileLock(f"{self._mapping_path}.lock")
 
     def _create_uuid(self, original_id: str) -> str:
-        import uuid
+        return self._create_uuids([original_id])[original_id]
 
-        new_id = str(uuid.uuid4())
-        self._mapping[original_id] = new_id
-        self.save()
-        return new_id
+    def _create_uuids(self, original_ids: List[str]) -> Dict[str, str]:
+        # One urandom call for the whole batch instead of one per uuid4()
+        raw = os.urandom(16 * len(original_ids))
+        created = {
+            original_id: str(uuid.UUID(bytes=raw[index * 16:(index + 1) * 16], version=4))
+            for index, original_id in enumerate(original_ids)
+        }
+        self._mapping.update(created)
+        if self._needs_compaction:
+            self.save()
+        else:
+            self._append(created)
+        return created
+
+    def _append(self, records: Dict[str, str]) -> None:
+        # Opened per append: compaction may replace the file underneath a held handle
+        try:
+            with open(self._mapping_path, "ab") as handle:
+                handle.write(b"".join(_encode_record({key: value}) for key, value in records.items()))
+                handle.flush()
+                os.fsync(handle.fileno())
+        except Exception as exc:
+            raise UUIDMappingException(str(exc)) from exc
+        self._log_records += len(records)
+        # Our own write under the lock; no need to reread it
+        self._signature = self._file_signature()
 
     def save(self) -> None:
+        """Rewrite the log with one record per live entry."""
         try:
-            atomic_write_json(str(self._mapping_path), self._mapping)
+            payload = b"".join(_encode_record({key: value}) for key, value in self._mapping.items())
+            atomic_write_bytes(str(self._mapping_path), payload)
         except Exception as exc:
             raise UUIDMappingException(str(exc)) from exc
+        self._log_records = len(self._mapping)
+        self._needs_compaction = False
+        self._signature = self._file_signature()
+
+
+def _encode_record(record: Dict[str, str]) -> bytes:
+    return dumps_json(record) + b"\n"
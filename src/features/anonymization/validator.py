@@ -1,17 +1,55 @@
-import re
-from typing import Iterable
+from typing import Dict, Iterable, Optional, Pattern
 
-from .pii_patterns import PIIPattern
+from src.core.exceptions import RedactionException
+from src.core.utils import is_linear_time
+
+from .pii_patterns import PIIPattern, combine_patterns
 
 
 class RedactionValidator:
-    """Validate that text no longer contains PII patterns."""
+    """Validate that text no longer contains PII patterns.
+
+    Under RE2 all patterns are checked in one fused scan; otherwise each
+    compiled pattern is searched in turn.
+    """
 
     def __init__(self, patterns: Iterable[PIIPattern]) -> None:
         self._patterns = list(patterns)
+        self._combined: Optional[Pattern[str]] = None
+        self._fused: Optional[bool] = None
+
+    def compile(self) -> None:
+        """Compile the patterns now instead of on the first ``validate`` call.
+
+        Raises ``RedactionException`` if a pattern is invalid.
+        """
+        if self._fused is not None:
+            return
+        try:
+            combined, _ = combine_patterns(self._patterns)
+            fused = is_linear_time(combined)
+            if not fused:
+                for pattern in self._patterns:
+                    pattern.compiled  # cached_property; first access compiles
+        except Exception as exc:
+            raise RedactionException(str(exc)) from exc
+        self._combined = combined if fused else None
+        self._fused = fused
 
     def validate(self, text: str) -> bool:
+        if not self._patterns:
+            return True
+        self.compile()
+        if self._fused:
+            return self._combined.search(text) is None
         for pattern in self._patterns:
-            if re.search(pattern.regex, text):
+            if pattern.compiled.search(text):
                 return False
         return True
+
+    def __getstate__(self) -> Dict:
+        """Exclude the compiled pattern from pickling; workers rebuild lazily."""
+        state = self.__dict__.copy()
+        state["_combined"] = None
+        state["_fused"] = None
+        return state
@@ -1,21 +1,51 @@
-from typing import Dict, Iterable
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Pattern
 
 from src.core.exceptions import ExtractionException
+from src.core.utils import compile_regex, is_linear_time
 
 from .extractors import BaseExtractor
 
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+
 
 class MetadataExtractor:
-    """Run all registered extractors and return a metadata dict."""
+    """Run all registered extractors and return a metadata dict.
+
+    Results are memoized by content digest (``cache_size`` entries, 0 to disable).
+    """
 
-    def __init__(self, extractors: Iterable[BaseExtractor]) -> None:
+    def __init__(self, extractors: Iterable[BaseExtractor], cache_size: int = 128) -> None:
         self._extractors = list(extractors)
+        self._scanned = [ext for ext in self._extractors if getattr(ext, "pattern", None) is not None]
+        self._combined = _combine([ext.pattern for ext in self._scanned])
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[bytes, Dict[str, object]]" = OrderedDict()
 
     def extract_all(self, text: str) -> Dict[str, object]:
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return _copy_metadata(cached)
+        metadata = self._extract_all(text)
+        if self._cache_size > 0:
+            self._cache[key] = _copy_metadata(metadata)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return metadata
+
+    def _extract_all(self, text: str) -> Dict[str, object]:
         try:
+            values = self._scan(text)
             metadata: Dict[str, object] = {}
             for extractor in self._extractors:
-                value = extractor.extract(text)
+                if id(extractor) in values:
+                    value = values[id(extractor)]
+                else:
+                    value = extractor.extract(text)
                 if value is None:
                     continue
                 if extractor.validate(value):
@@ -23,3 +53,60 @@ class MetadataExtractor:
             return metadata
         except Exception as exc:
             raise ExtractionException(str(exc)) from exc
+
+    def _scan(self, text: str) -> Dict[int, Optional[object]]:
+        values: Dict[int, Optional[object]] = {}
+        if self._combined is None:
+            return values
+        # Extractors the scan never reaches found nothing
+        values = dict.fromkeys(map(id, self._scanned))
+        pending = list(self._scanned)
+        pos = 0
+        # Stop as soon as every field has been found instead of scanning to the end
+        while pending:
+            hit = self._combined.search(text, pos)
+            if hit is None:
+                break
+            start = hit.start()
+            # Several extractors may match at the same position; check each
+            for extractor in list(pending):
+                match = extractor.pattern.match(text, start)
+                if match is not None:
+                    values[id(extractor)] = extractor.parse(match)
+                    pending.remove(extractor)
+            # Step one character, not past the hit: other patterns may start inside it
+            pos = start + 1
+        return values
+
+    def __getstate__(self) -> Dict:
+        """Exclude the fused pattern and cache from pickling; the pattern is rebuilt on load."""
+        state = self.__dict__.copy()
+        state["_combined"] = None
+        state["_cache"] = OrderedDict()
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._combined = _combine([ext.pattern for ext in self._scanned])
+
+
+def _copy_metadata(metadata: Dict[str, object]) -> Dict[str, object]:
+    # List values (findings) are copied too, so a caller mutating its result
+    # cannot change what the cache returns for the same text later
+    return {name: list(value) if isinstance(value, list) else value for name, value in metadata.items()}
+
+
+def _combine(patterns: List[Pattern[str]]) -> Optional[Pattern[str]]:
+    if not patterns:
+        return None
+    parts = []
+    for pattern in patterns:
+        # RE2 patterns carry their flags inline in the pattern text
+        flags = "".join(letter for flag, letter in _SCOPED_FLAGS if getattr(pattern, "flags", 0) & flag)
+        parts.append(f"(?{flags}:{pattern.pattern})" if flags else f"(?:{pattern.pattern})")
+    combined = compile_regex("|".join(parts))
+    return combined if _fusion_pays_off(combined) else None
+
+
+def _fusion_pays_off(combined: Pattern[str]) -> bool:
+    return is_linear_time(combined)
@@ -1,19 +1,23 @@
 import re
-from typing import Optional
+from typing import Match, Optional
+
+from src.core.utils import compile_regex
 
 from .base import BaseExtractor
 
 
 class AgeExtractor(BaseExtractor):
+    # 0-120 is enforced by the pattern, so out-of-range numbers never match.
+    # The consuming (?:\D|$) tail, not \b or a lookahead, keeps unit suffixes
+    # like "30y" matching and stays RE2-compatible
+    pattern = compile_regex(r"Age[:\-]?\s*(120|1[01]\d|\d{1,2})(?:\D|$)", re.IGNORECASE)
+
     @property
     def field_name(self) -> str:
         return "age"
 
-    def extract(self, text: str) -> Optional[int]:
-        match = re.search(r"Age[:\-]?\s*(\d+)", text, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
-        return None
+    def parse(self, match: Match[str]) -> Optional[int]:
+        return int(match.group(1))
 
     def validate(self, value: object) -> bool:
         return isinstance(value, int) and 0 <= value <= 120
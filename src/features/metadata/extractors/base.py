@@ -1,17 +1,31 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Match, Optional, Pattern
 
 
 class BaseExtractor(ABC):
-    """Base interface for metadata extractors."""
+    """Base interface for metadata extractors.
+
+    Regex-based extractors set ``pattern`` and implement ``parse`` for the
+    first match; ``MetadataExtractor`` can then find them all in one scan.
+    Other extractors override ``extract`` directly.
+    """
+
+    pattern: Optional[Pattern[str]] = None
 
     @property
     @abstractmethod
     def field_name(self) -> str:
         raise NotImplementedError
 
-    @abstractmethod
     def extract(self, text: str) -> Optional[object]:
+        if self.pattern is None:
+            raise NotImplementedError
+        match = self.pattern.search(text)
+        if match:
+            return self.parse(match)
+        return None
+
+    def parse(self, match: Match[str]) -> Optional[object]:
         raise NotImplementedError
 
     @abstractmethod
@@ -1,19 +1,27 @@
 import re
-from typing import Optional
+from typing import Match, Optional
+
+from src.core.utils import compile_regex
 
 from .base import BaseExtractor
 
 
 class BMIExtractor(BaseExtractor):
+    # 0-100 is enforced by the pattern, matching validate(). The consuming
+    # tail, not \b or a lookahead, keeps unit suffixes like "23.5kg/m2"
+    # matching, stops a backtrack from "23.5" to "23" and stays
+    # RE2-compatible; a sentence-ending "23." still reads as 23.0
+    pattern = compile_regex(
+        r"BMI[:\-]?\s*(100(?:\.0+)?|\d{1,2}(?:\.\d+)?)(?:[^\d.]|\.(?:\D|$)|$)",
+        re.IGNORECASE,
+    )
+
     @property
     def field_name(self) -> str:
         return "BMI"
 
-    def extract(self, text: str) -> Optional[float]:
-        match = re.search(r"BMI[:\-]?\s*([0-9]+\.?[0-9]*)", text, re.IGNORECASE)
-        if match:
-            return float(match.group(1))
-        return None
+    def parse(self, match: Match[str]) -> Optional[float]:
+        return float(match.group(1))
 
     def validate(self, value: object) -> bool:
         return isinstance(value, float) and 0.0 <= value <= 100.0
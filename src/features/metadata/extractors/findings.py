@@ -1,24 +1,41 @@
 import re
-from typing import List, Optional
+from typing import List, Match, Optional
+
+from src.core.utils import compile_regex
 
 from .base import BaseExtractor
 
+_START = compile_regex(r"Examination Findings", re.IGNORECASE)
+_END = compile_regex(r"Conclusion", re.IGNORECASE)
+
 
 class FindingsExtractor(BaseExtractor):
+    # Used by the fused scan; extract() below finds the same span with two
+    # literal searches, so a report without "Conclusion" costs one pass
+    pattern = compile_regex(
+        r"Examination Findings\s*(.*?)\s*Conclusion",
+        re.DOTALL | re.IGNORECASE,
+    )
+
     @property
     def field_name(self) -> str:
         return "findings"
 
     def extract(self, text: str) -> Optional[List[str]]:
-        match = re.search(
-            r"Examination Findings\s*(.*?)\s*Conclusion",
-            text,
-            re.DOTALL | re.IGNORECASE,
-        )
-        if not match:
+        start = _START.search(text)
+        if start is None:
             return None
-        findings_text = match.group(1)
-        lines = [line.strip() for line in findings_text.strip().split("\n") if line.strip()]
+        end = _END.search(text, start.end())
+        if end is None:
+            return None
+        return self._split(text[start.end():end.start()])
+
+    def parse(self, match: Match[str]) -> Optional[List[str]]:
+        return self._split(match.group(1))
+
+    @staticmethod
+    def _split(findings_text: str) -> Optional[List[str]]:
+        lines = [stripped for line in findings_text.splitlines() if (stripped := line.strip())]
         return lines or None
 
     def validate(self, value: object) -> bool:
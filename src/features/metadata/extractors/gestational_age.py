@@ -1,19 +1,20 @@
 import re
-from typing import Optional
+from typing import Match, Optional
+
+from src.core.utils import compile_regex
 
 from .base import BaseExtractor
 
 
 class GestationalAgeExtractor(BaseExtractor):
+    pattern = compile_regex(r"GA[:\-]?\s*(\d+\s*weeks?\s*\d*\s*day[s]?)", re.IGNORECASE)
+
     @property
     def field_name(self) -> str:
         return "gestational_age"
 
-    def extract(self, text: str) -> Optional[str]:
-        match = re.search(r"GA[:\-]?\s*(\d+\s*weeks?\s*\d*\s*day[s]?)", text, re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-        return None
+    def parse(self, match: Match[str]) -> Optional[str]:
+        return match.group(1).strip()
 
     def validate(self, value: object) -> bool:
         return isinstance(value, str) and len(value) > 0
@@ -9,6 +9,12 @@ class OCRConfig:
     poppler_path: str
     dpi: int
     language: str
+    concurrency: int = 1
+    cache_dir: str = ""
+    # Minimum embedded-text characters per page to skip OCR; 0 always runs OCR
+    text_layer_min_chars: int = 0
+    # Re-run OCR at this DPI when the first pass finds no text; 0 disables
+    fallback_dpi: int = 0
 
 
 def load_ocr_config(settings: Settings) -> OCRConfig:
@@ -17,4 +23,8 @@ def load_ocr_config(settings: Settings) -> OCRConfig:
         poppler_path=settings.poppler_path,
         dpi=settings.ocr_dpi,
         language=settings.ocr_language,
+        concurrency=settings.ocr_concurrency,
+        cache_dir=settings.ocr_cache_dir,
+        text_layer_min_chars=settings.ocr_text_layer_min_chars,
+        fallback_dpi=settings.ocr_fallback_dpi,
     )
@@ -1,9 +1,14 @@
+import tempfile
+from typing import List
+
 from src.core.exceptions import OCRException
 from src.core.utils import validate_text_not_empty
 
 from .config import OCRConfig
+from .page_cache import CachedPDFConverter
 from .pdf_converter import PDFConverter
 from .text_extractor import TextExtractor
+from .text_layer import TextLayerExtractor
 
 
 class OCREngine:
@@ -11,15 +16,41 @@ class OCREngine:
 
     def __init__(self, config: OCRConfig) -> None:
         self._converter = PDFConverter(config.poppler_path)
+        if config.cache_dir:
+            self._converter = CachedPDFConverter(self._converter, config.cache_dir)
         self._extractor = TextExtractor(config.tesseract_path, config.language)
         self._dpi = config.dpi
+        self._fallback_dpi = config.fallback_dpi
+        self._concurrency = config.concurrency
+        self._text_layer = TextLayerExtractor(config.poppler_path)
+        self._text_layer_min_chars = config.text_layer_min_chars
 
     def extract_text(self, pdf_path: str) -> str:
         try:
-            images = self._converter.convert(pdf_path, self._dpi)
-            text_parts = [self._extractor.extract(image) for image in images]
-            text = "\n".join(text_parts)
+            if self._text_layer_min_chars > 0:
+                # Text-native PDFs skip rasterization and Tesseract entirely
+                pages = self._text_layer.extract_pages(pdf_path)
+                if self._text_layer_usable(pages):
+                    return "\n".join(pages)
+            text = self._ocr(pdf_path, self._dpi)
+            if not text.strip() and self._fallback_dpi > self._dpi:
+                # Only faint or tiny print needs the slower high-resolution pass
+                text = self._ocr(pdf_path, self._fallback_dpi)
             validate_text_not_empty(text)
             return text
         except Exception as exc:
             raise OCRException(str(exc)) from exc
+
+    def _ocr(self, pdf_path: str, dpi: int) -> str:
+        # Pages go to disk and Tesseract reads the files, so no page is
+        # ever decoded into this process and memory stays flat per page count
+        with tempfile.TemporaryDirectory(prefix="ocr-pages-") as page_dir:
+            pages = self._converter.convert_to_files(pdf_path, dpi, page_dir)
+            text_parts = self._extractor.extract_many(pages, self._concurrency)
+        return "\n".join(text_parts)
+
+    def _text_layer_usable(self, pages: List[str]) -> bool:
+        # Judged per page: a blank page is likely a scan inside an otherwise
+        # digital PDF, and a long first page must not hide sparse later ones
+        lengths = [len(page.strip()) for page in pages]
+        return bool(lengths) and all(lengths) and sum(lengths) >= self._text_layer_min_chars * len(lengths)
@@ -0,0 +1,70 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List
+
+from src.core.exceptions import PDFConversionException
+
+from .pdf_converter import PDFConverter
+
+
+class CachedPDFConverter:
+    """Reuse rendered page images across runs via an on-disk cache.
+
+    Entries live in ``cache_dir/<content hash>_<dpi>/`` as numbered PNGs, so
+    re-running the same corpus (or retrying a file) skips poppler entirely.
+    Keys hash the file contents, so renamed copies share an entry and edited
+    files miss. Entries are published with an atomic directory rename, so
+    concurrent workers never see a partial one. Entries are never evicted;
+    they hold PHI, so delete the directory once a corpus is processed.
+    """
+
+    def __init__(self, converter: PDFConverter, cache_dir: str) -> None:
+        self._converter = converter
+        self._cache_dir = Path(cache_dir)
+
+    def convert_to_files(self, pdf_path: str, dpi: int, output_dir: str) -> List[str]:
+        entry = self._cache_dir / f"{_file_digest(pdf_path)}_{dpi}"
+        if entry.is_dir():
+            return _page_paths(entry)
+
+        try:
+            return self._store(entry, pdf_path, dpi)
+        except OSError:
+            # The cache is an optimisation; a full disk must not fail the file
+            return self._converter.convert_to_files(pdf_path, dpi, output_dir)
+
+    def _store(self, entry: Path, pdf_path: str, dpi: int) -> List[str]:
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        staging = tempfile.mkdtemp(dir=self._cache_dir, prefix=".tmp-")
+        try:
+            paths = self._converter.convert_to_files(pdf_path, dpi, staging)
+            for index, path in enumerate(paths):
+                os.rename(path, os.path.join(staging, f"{index:04d}.png"))
+            os.rename(staging, entry)
+        except OSError:
+            # Another worker may have published the same entry first
+            shutil.rmtree(staging, ignore_errors=True)
+            if not entry.is_dir():
+                raise
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return _page_paths(entry)
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as handle:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(block)
+    except OSError as exc:
+        raise PDFConversionException(str(exc)) from exc
+    return digest.hexdigest()
+
+
+def _page_paths(entry: Path) -> List[str]:
+    return [str(path) for path in sorted(entry.glob("*.png"))]
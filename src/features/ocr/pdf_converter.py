@@ -7,13 +7,39 @@ from src.core.exceptions import PDFConversionException
 
 
 class PDFConverter:
-    """Convert PDF pages to images for OCR."""
+    """Convert PDF pages to images for OCR.
+
+    Pages are rendered in grayscale: Tesseract binarizes its input anyway,
+    so colour only triples the pixels poppler writes and Tesseract reads.
+    """
 
     def __init__(self, poppler_path: str) -> None:
         self.poppler_path = poppler_path or None
 
     def convert(self, pdf_path: str, dpi: int) -> List[Image.Image]:
         try:
-            return convert_from_path(pdf_path, dpi=dpi, poppler_path=self.poppler_path)
+            return convert_from_path(
+                pdf_path, dpi=dpi, poppler_path=self.poppler_path, grayscale=True
+            )
+        except Exception as exc:
+            raise PDFConversionException(str(exc)) from exc
+
+    def convert_to_files(self, pdf_path: str, dpi: int, output_dir: str) -> List[str]:
+        """Render pages as PNG files in ``output_dir`` and return their paths in page order.
+
+        Pages are never decoded into memory, and Tesseract can read the
+        files directly.
+        """
+        try:
+            return convert_from_path(
+                pdf_path,
+                dpi=dpi,
+                poppler_path=self.poppler_path,
+                grayscale=True,
+                output_folder=output_dir,
+                output_file="page",
+                fmt="png",
+                paths_only=True,
+            )
         except Exception as exc:
             raise PDFConversionException(str(exc)) from exc
@@ -1,8 +1,19 @@
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence, Union
+
 import pytesseract
 from PIL import Image
 
 from src.core.exceptions import TextExtractionException
 
+logger = logging.getLogger("medical_report_etl")
+
+# Pages per list-file invocation; very long lists have been seen to stall Tesseract
+LIST_BATCH_SIZE = 50
+
 
 class TextExtractor:
     """Extract text from images using Tesseract."""
@@ -11,8 +22,47 @@ class TextExtractor:
         pytesseract.pytesseract.tesseract_cmd = tesseract_path
         self.language = language
 
-    def extract(self, image: Image.Image) -> str:
+    def extract(self, image: Union[Image.Image, str]) -> str:
+        """OCR one page, given as an image or the path of an image file."""
         try:
             return pytesseract.image_to_string(image, lang=self.language)
         except Exception as exc:
             raise TextExtractionException(str(exc)) from exc
+
+    def extract_many(self, images: Sequence[Union[Image.Image, str]], concurrency: int = 1) -> List[str]:
+        """OCR several pages, returning texts in page order.
+
+        Each page is a separate Tesseract subprocess, so with ``concurrency``
+        above 1 threads overlap them without contending for the GIL. Run
+        sequentially, pages given as file paths are OCR'd through a list file
+        instead, so one Tesseract process loads the model once per batch.
+        """
+        if concurrency > 1 and len(images) > 1:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(images))) as executor:
+                return list(executor.map(self.extract, images))
+        if len(images) > 1 and all(isinstance(image, str) for image in images):
+            texts: List[str] = []
+            for offset in range(0, len(images), LIST_BATCH_SIZE):
+                texts.extend(self._extract_listed(images[offset:offset + LIST_BATCH_SIZE]))
+            return texts
+        return [self.extract(image) for image in images]
+
+    def _extract_listed(self, paths: Sequence[str]) -> List[str]:
+        # Next to the pages, so it is cleaned up with the engine's page directory
+        list_dir = os.path.dirname(paths[0]) or None
+        fd, list_path = tempfile.mkstemp(prefix="tess_list_", suffix=".txt", dir=list_dir)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as listing:
+                listing.write("\n".join(paths) + "\n")
+            output = pytesseract.image_to_string(list_path, lang=self.language)
+        except (pytesseract.TesseractError, OSError) as exc:
+            logger.warning("Tesseract list mode failed, OCR'ing %d pages one by one: %s", len(paths), exc)
+            output = None
+        finally:
+            os.remove(list_path)
+        # Tesseract ends every page with a form feed, exactly as per-page calls do
+        pages = output.split("\f") if output is not None else []
+        if len(pages) != len(paths) + 1:
+            # List mode failed or pages did not line up; OCR them one by one
+            return [self.extract(path) for path in paths]
+        return [page + "\f" for page in pages[:-1]]
@@ -0,0 +1,34 @@
+import os
+import subprocess
+from typing import List
+
+
+class TextLayerExtractor:
+    """Read the embedded text layer of a PDF with poppler's ``pdftotext``.
+
+    Text-native PDFs need no OCR at all. Any failure (missing binary, scanned
+    PDF, timeout) yields an empty string so callers can fall back to OCR.
+    """
+
+    def __init__(self, poppler_path: str, timeout: float = 10.0) -> None:
+        self._command = os.path.join(poppler_path, "pdftotext") if poppler_path else "pdftotext"
+        self._timeout = timeout
+
+    def extract(self, pdf_path: str) -> str:
+        # OCR output joins pages with newlines; match it
+        return "\n".join(self.extract_pages(pdf_path))
+
+    def extract_pages(self, pdf_path: str) -> List[str]:
+        """Return the text of each page; an empty list when there is no text layer."""
+        try:
+            output = subprocess.run(
+                [self._command, "-layout", "-enc", "UTF-8", pdf_path, "-"],
+                capture_output=True,
+                check=True,
+                timeout=self._timeout,
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            return []
+        # pdftotext ends every page with a form feed
+        pages = output.decode("utf-8", errors="replace").split("\f")
+        return pages[:-1] if pages and not pages[-1].strip() else pages
@@ -3,28 +3,69 @@ from typing import Dict, List
 from src.core.exceptions import JSONSerializationException
 from src.core.utils import atomic_write_json
 
+# Output fields in order; aliases repeat a source field under a legacy name
+_FIELDS = (
+    ("patient_id", "patient_id"),
+    ("gestational_age", "gestational_age"),
+    ("age", "age"),
+    ("demographic_age", "age"),
+    ("BMI", "BMI"),
+    ("findings", "findings"),
+    ("examination_findings", "findings"),
+)
+
+LAYOUTS = ("records", "columns")
+
 
 class JSONSerializer:
-    """Serialize metadata with backward-compatible aliases."""
+    """Serialize metadata with backward-compatible aliases.
+
+    ``layout="records"`` (default) writes one object per report under
+    ``dataResources``. ``layout="columns"`` writes one list per field instead,
+    which is smaller and faster to emit for large batches and loads directly
+    into dataframe tools. Output is compact unless ``pretty`` is set.
+    """
+
+    def __init__(self, layout: str = "records", pretty: bool = False) -> None:
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown JSON layout {layout!r}; expected one of {LAYOUTS}")
+        self._layout = layout
+        self._pretty = pretty
 
     def serialize(self, metadata_list: List[Dict[str, object]], output_path: str) -> None:
         try:
-            payload = {"dataResources": []}
-            for entry in metadata_list:
-                age = entry.get("age")
-                findings = entry.get("findings", [])
-                payload["dataResources"].append(
-                    {
-                        "patient_id": entry.get("patient_id"),
-                        "gestational_age": entry.get("gestational_age"),
-                        "age": age,
-                        "demographic_age": age,
-                        "BMI": entry.get("BMI"),
-                        "findings": findings,
-                        "examination_findings": findings,
-                    }
-                )
-
-            atomic_write_json(output_path, payload)
+            if self._layout == "columns":
+                payload = {"dataResources": self._columns(metadata_list)}
+            else:
+                payload = {"dataResources": self._records(metadata_list)}
+
+            atomic_write_json(output_path, payload, pretty=self._pretty)
         except Exception as exc:
             raise JSONSerializationException(str(exc)) from exc
+
+    @staticmethod
+    def _records(metadata_list: List[Dict[str, object]]) -> List[Dict[str, object]]:
+        # Each aliased field is looked up once and bound for its alias
+        return [
+            {
+                "patient_id": entry.get("patient_id"),
+                "gestational_age": entry.get("gestational_age"),
+                "age": (age := entry.get("age")),
+                "demographic_age": age,
+                "BMI": entry.get("BMI"),
+                "findings": (findings := entry.get("findings", [])),
+                "examination_findings": findings,
+            }
+            for entry in metadata_list
+        ]
+
+    @staticmethod
+    def _columns(metadata_list: List[Dict[str, object]]) -> Dict[str, List[object]]:
+        columns: Dict[str, List[object]] = {}
+        for name, source in _FIELDS:
+            if source != name and source in columns:
+                columns[name] = columns[source]
+                continue
+            default = [] if source == "findings" else None
+            columns[name] = [entry.get(source, default) for entry in metadata_list]
+        return columns
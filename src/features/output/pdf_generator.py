@@ -13,11 +13,9 @@ class PDFGenerator:
             pdf.add_page()
             pdf.set_font("Arial", size=12)
 
-            def sanitize(text: str) -> str:
-                return text.encode("latin-1", errors="replace").decode("latin-1")
-
-            for line in anonymized_text.split("\n"):
-                pdf.multi_cell(0, 10, sanitize(line))
+            # One multi_cell call lays out every line; the core fonts are latin-1 only
+            text = anonymized_text.encode("latin-1", errors="replace").decode("latin-1")
+            pdf.multi_cell(0, 10, text)
 
             pdf.output(output_path)
         except Exception as exc:
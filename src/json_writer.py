@@ -1,5 +1,4 @@
-import warnings
-
+from src.core.utils import warn_once
 from src.features.output import JSONSerializer
 
 
@@ -8,9 +7,5 @@ _serializer = JSONSerializer()
 
 def save_metadata_json(metadata_list, output_path):
     """Backward-compatible wrapper for JSON serialization."""
-    warnings.warn(
-        "save_metadata_json is deprecated; use JSONSerializer from src.features.output",
-        DeprecationWarning,
-        stacklevel=2,
-    )
+    warn_once("save_metadata_json is deprecated; use JSONSerializer from src.features.output")
     _serializer.serialize(metadata_list, output_path)
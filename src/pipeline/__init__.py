@@ -1,13 +1,16 @@
 from .context import PipelineContext
+from .factory import build_pipeline
 from .orchestrator import ETLPipeline
-from .stages import AnonymizationStage, BasePipelineStage, ExtractionStage, OCRStage, OutputStage
+from .stages import AnonymizationStage, BasePipelineStage, ExtractionStage, OCRStage, OutputStage, TextAnalysisStage
 
 __all__ = [
     "PipelineContext",
     "ETLPipeline",
+    "build_pipeline",
     "AnonymizationStage",
     "BasePipelineStage",
     "ExtractionStage",
     "OCRStage",
     "OutputStage",
+    "TextAnalysisStage",
 ]
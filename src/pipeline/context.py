@@ -1,7 +1,17 @@
+import os
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 
+def file_stem(pdf_path: str) -> str:
+    """File name without directory or extension; string ops, no ``Path`` object."""
+    return os.path.splitext(os.path.basename(pdf_path))[0]
+
+
+# Fields left out of the pickle while unset
+_OPTIONAL_FIELDS = ("extracted_text", "anonymized_text", "anonymized_pdf_path")
+
+
 @dataclass
 class PipelineContext:
     pdf_path: str
@@ -10,6 +20,25 @@ class PipelineContext:
     metadata: Dict[str, object] = field(default_factory=dict)
     anonymized_pdf_path: Optional[str] = None
     errors: List[str] = field(default_factory=list)
+    # Computed once from pdf_path for every stage that needs the file name
+    stem: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.stem = file_stem(self.pdf_path)
+
+    def __getstate__(self) -> Dict:
+        """Pickle only the fields that are set; workers return many early-error contexts."""
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if value is not None and name != "stem"
+        }
+
+    def __setstate__(self, state: Dict) -> None:
+        for name in _OPTIONAL_FIELDS:
+            state.setdefault(name, None)
+        self.__dict__.update(state)
+        self.stem = file_stem(self.pdf_path)
 
     def add_error(self, stage: str, message: str) -> None:
         self.errors.append(f"{stage}: {message}")
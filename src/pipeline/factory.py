@@ -0,0 +1,76 @@
+"""Build pipelines, sharing settings-independent components per process.
+
+The shared redactor and extractor cache document results; ``reset()`` drops them.
+"""
+
+from functools import lru_cache
+
+from src.core import Settings
+from src.features.anonymization import (
+    PIIRedactor,
+    RedactionValidator,
+    UUIDMappingService,
+    build_default_registry,
+    load_anonymization_config,
+)
+from src.features.metadata import (
+    AgeExtractor,
+    BMIExtractor,
+    FindingsExtractor,
+    GestationalAgeExtractor,
+    MetadataExtractor,
+)
+from src.features.ocr import OCREngine, load_ocr_config
+from src.features.output import JSONSerializer, PDFGenerator
+
+from .orchestrator import ETLPipeline
+from .stages import OCRStage, OutputStage, TextAnalysisStage
+
+
+@lru_cache(maxsize=None)
+def get_redactor() -> PIIRedactor:
+    return PIIRedactor(build_default_registry().get_all())
+
+
+@lru_cache(maxsize=None)
+def get_validator() -> RedactionValidator:
+    return RedactionValidator(build_default_registry().get_all())
+
+
+@lru_cache(maxsize=None)
+def get_metadata_extractor() -> MetadataExtractor:
+    return MetadataExtractor(
+        [
+            GestationalAgeExtractor(),
+            AgeExtractor(),
+            BMIExtractor(),
+            FindingsExtractor(),
+        ]
+    )
+
+
+@lru_cache(maxsize=None)
+def get_pdf_generator() -> PDFGenerator:
+    return PDFGenerator()
+
+
+def build_pipeline(settings: Settings) -> ETLPipeline:
+    stages = [
+        OCRStage(OCREngine(load_ocr_config(settings))),
+        TextAnalysisStage(
+            get_redactor(),
+            get_validator(),
+            get_metadata_extractor(),
+            load_anonymization_config(settings),
+        ),
+        OutputStage(get_pdf_generator(), UUIDMappingService(settings.id_map_file), settings.output_dir),
+    ]
+    # Indented output is for humans reading debug runs; machines get compact JSON
+    pretty = settings.log_level.upper() == "DEBUG"
+    return ETLPipeline(stages, JSONSerializer(settings.json_layout, pretty=pretty))
+
+
+def reset() -> None:
+    """Drop the shared components so the next build creates fresh ones."""
+    for getter in (get_redactor, get_validator, get_metadata_extractor, get_pdf_generator):
+        getter.cache_clear()
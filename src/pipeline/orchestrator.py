@@ -1,10 +1,17 @@
-from typing import Iterable, List
+import concurrent.futures
+import logging
+import os
+import time
+from collections import deque
+from typing import Callable, Deque, Iterable, List, Optional, Sequence
 
 from src.features.output import JSONSerializer
 
 from .context import PipelineContext
 from .stages.base import BasePipelineStage
 
+logger = logging.getLogger("medical_report_etl.pipeline")
+
 
 class ETLPipeline:
     def __init__(self, stages: Iterable[BasePipelineStage], json_serializer: JSONSerializer) -> None:
@@ -12,41 +19,90 @@ class ETLPipeline:
         self._json_serializer = json_serializer
 
     def run_single(self, pdf_path: str) -> PipelineContext:
-        context = PipelineContext(pdf_path=pdf_path)
+        return _run_stages(self._stages, PipelineContext(pdf_path=pdf_path))
+
+    def _split_io_stages(self) -> int:
+        """Index where the trailing run of ``io_bound`` stages starts."""
+        split = len(self._stages)
+        while split > 0 and getattr(self._stages[split - 1], "io_bound", False):
+            split -= 1
+        return split
+
+    def _prepare(self, pdf_paths: List[str]) -> None:
         for stage in self._stages:
-            context = stage.execute(context)
-        return context
+            prepare = getattr(stage, "prepare", None)
+            if prepare is not None:
+                prepare(pdf_paths)
 
     def run_batch(self, pdf_paths: List[str], json_output_path: str) -> List[PipelineContext]:
         results: List[PipelineContext] = []
         metadata_list = []
+        progress = _Progress(len(pdf_paths))
+        self._prepare(pdf_paths)
 
-        for pdf_path in pdf_paths:
-            context = self.run_single(pdf_path)
+        def collect(context: PipelineContext) -> None:
             results.append(context)
+            progress.advance()
             if not context.has_errors():
                 metadata_list.append(context.metadata)
 
+        split = self._split_io_stages()
+        if split in (0, len(self._stages)):
+            for pdf_path in pdf_paths:
+                collect(self.run_single(pdf_path))
+        else:
+            # File writes for document j overlap OCR of document j+1; one writer
+            # thread keeps output in order and shared services single-threaded
+            compute_stages, io_stages = self._stages[:split], self._stages[split:]
+            pending: Deque["concurrent.futures.Future[PipelineContext]"] = deque()
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="etl-output"
+            ) as writer:
+                for pdf_path in pdf_paths:
+                    context = _run_stages(compute_stages, PipelineContext(pdf_path=pdf_path))
+                    pending.append(writer.submit(_run_stages, io_stages, context))
+                    while pending and pending[0].done():
+                        collect(pending.popleft().result())
+                while pending:
+                    collect(pending.popleft().result())
+
         if metadata_list:
             self._json_serializer.serialize(metadata_list, json_output_path)
 
         return results
 
-    def run_batch_parallel(self, pdf_paths: List[str], json_output_path: str, max_workers: int = None) -> List[PipelineContext]:
-        """Run pipeline in parallel using ProcessPoolExecutor."""
-        import concurrent.futures
-        
+    def run_batch_parallel(
+        self,
+        pdf_paths: List[str],
+        json_output_path: str,
+        max_workers: Optional[int] = None,
+        executor_factory: Optional[Callable[..., concurrent.futures.Executor]] = None,
+    ) -> List[PipelineContext]:
+        """Run pipeline in parallel using ProcessPoolExecutor.
+
+        ``max_workers`` defaults to ``os.cpu_count()``; files are independent,
+        so results are merged in the parent as workers complete. The pipeline
+        is pickled once per worker (via the pool initializer), not per file.
+        ``executor_factory`` replaces the process pool (e.g. a thread pool in
+        tests); it is called with ``max_workers``, ``initializer`` and
+        ``initargs``.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers == 1:
+            # A one-worker pool only adds spawn and pickling cost
+            return self.run_batch(pdf_paths, json_output_path)
         results: List[PipelineContext] = []
         metadata_list = []
-        
-        # Use helper function to avoid pickling bound methods if possible, 
-        # but self.run_single should work if self is picklable.
-        # If self contains unpicklable resources (like open files), this will fail.
-        # Assuming stages are data-only configuration + code.
-
-        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, initializer=_worker_init) as executor:
-            # We map run_single to pdf_paths
-            future_to_pdf = {executor.submit(self.run_single, pdf_path): pdf_path for pdf_path in pdf_paths}
+        progress = _Progress(len(pdf_paths))
+        self._prepare(pdf_paths)
+
+        # Stages must be picklable (data-only configuration + code); tasks then
+        # carry only the path and workers reuse their copy of the pipeline
+        executor_factory = executor_factory or concurrent.futures.ProcessPoolExecutor
+        with executor_factory(
+            max_workers=max_workers, initializer=_worker_init, initargs=(self,)
+        ) as executor:
+            future_to_pdf = {executor.submit(_run_one, pdf_path): pdf_path for pdf_path in pdf_paths}
             
             for future in concurrent.futures.as_completed(future_to_pdf):
                 pdf_path = future_to_pdf[future]
@@ -60,6 +116,7 @@ class ETLPipeline:
                     error_context = PipelineContext(pdf_path=pdf_path)
                     error_context.add_error("System", f"Worker process failed: {str(exc)}")
                     results.append(error_context)
+                progress.advance()
 
         if metadata_list:
             self._json_serializer.serialize(metadata_list, json_output_path)
@@ -67,9 +124,45 @@ class ETLPipeline:
         return results
 
 
-def _worker_init():
+def _run_stages(stages: Sequence[BasePipelineStage], context: PipelineContext) -> PipelineContext:
+    for stage in stages:
+        context = stage.execute(context)
+    return context
+
+
+_WORKER_PIPELINE: Optional[ETLPipeline] = None
+
+
+def _worker_init(pipeline: Optional[ETLPipeline] = None) -> None:
     """Initialize worker process environment."""
-    import os
-    # Limit Tesseract/OpenMP threads to prevent CPU oversubscription
-    os.environ["OMP_THREAD_LIMIT"] = "1"
+    global _WORKER_PIPELINE
+    # Limit Tesseract/OpenMP/BLAS threads to prevent CPU oversubscription,
+    # unless the operator exported an explicit limit
+    for variable in ("OMP_THREAD_LIMIT", "OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ.setdefault(variable, "1")
+    _WORKER_PIPELINE = pipeline
+
+
+def _run_one(pdf_path: str) -> PipelineContext:
+    return _WORKER_PIPELINE.run_single(pdf_path)
+
+
+class _Progress:
+    """Log batch progress at most once per ``interval`` seconds.
+
+    Completions are counted in the parent, so no cross-process counter or
+    per-file output is needed.
+    """
+
+    def __init__(self, total: int, interval: float = 1.0) -> None:
+        self._total = total
+        self._interval = interval
+        self._done = 0
+        self._last = time.monotonic()
 
+    def advance(self) -> None:
+        self._done += 1
+        now = time.monotonic()
+        if self._done == self._total or now - self._last >= self._interval:
+            self._last = now
+            logger.info("Processed %d/%d files", self._done, self._total)
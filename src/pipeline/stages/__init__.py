@@ -3,6 +3,7 @@ from .base import BasePipelineStage
 from .extraction_stage import ExtractionStage
 from .ocr_stage import OCRStage
 from .output_stage import OutputStage
+from .text_analysis_stage import TextAnalysisStage
 
 __all__ = [
     "AnonymizationStage",
@@ -10,4 +11,5 @@ __all__ = [
     "ExtractionStage",
     "OCRStage",
     "OutputStage",
+    "TextAnalysisStage",
 ]
@@ -1,24 +1,43 @@
-from src.features.anonymization import PIIRedactor, RedactionValidator
+import logging
+from typing import List, Optional
+
+from src.core.exceptions import RedactionException
+from src.features.anonymization import AnonymizationConfig, PIIRedactor, RedactionValidator
 
 from ..context import PipelineContext
 from .base import BasePipelineStage
 
+logger = logging.getLogger("medical_report_etl.pipeline")
+
 
 class AnonymizationStage(BasePipelineStage):
     name = "Anonymization"
 
-    def __init__(self, redactor: PIIRedactor, validator: RedactionValidator) -> None:
+    def __init__(
+        self,
+        redactor: PIIRedactor,
+        validator: RedactionValidator,
+        config: Optional[AnonymizationConfig] = None,
+    ) -> None:
         self._redactor = redactor
         self._validator = validator
+        self._validate = (config or AnonymizationConfig()).enable_validation
 
-    def execute(self, context: PipelineContext) -> PipelineContext:
-        if context.extracted_text is None:
-            context.add_error(self.name, "No extracted text")
-            return context
+    def prepare(self, pdf_paths: List[str]) -> None:
+        # Compiled in the parent so forked workers inherit the patterns
+        # instead of each compiling its own copy
         try:
-            context.anonymized_text = self._redactor.redact(context.extracted_text)
-            if not self._validator.validate(context.anonymized_text):
-                context.add_error(self.name, "Redaction validation failed")
-        except Exception as exc:
-            context.add_error(self.name, str(exc))
-        return context
+            self._redactor.compile()
+            if self._validate:
+                self._validator.compile()
+        except RedactionException as exc:
+            # Redacting each file raises it again and records it there
+            logger.warning("Could not compile PII patterns: %s", exc)
+
+    def check(self, context: PipelineContext) -> Optional[str]:
+        return "No extracted text" if context.extracted_text is None else None
+
+    def run(self, context: PipelineContext) -> None:
+        context.anonymized_text = self._redactor.redact(context.extracted_text)
+        if self._validate and not self._validator.validate(context.anonymized_text):
+            context.add_error(self.name, "Redaction validation failed")
@@ -1,14 +1,44 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional
 
 from ..context import PipelineContext
 
 
 class BasePipelineStage(ABC):
+    # Trailing stages marked io_bound (file writes) run on a background
+    # thread in ``run_batch``, overlapping the next file's processing
+    io_bound: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
         raise NotImplementedError
 
-    @abstractmethod
     def execute(self, context: PipelineContext) -> PipelineContext:
-        raise NotImplementedError
+        """Run the stage; a failed precondition or any exception becomes a context error.
+
+        This is the override point of the stage contract. The default runs
+        ``check`` then ``run`` with the error handling written once here, so
+        most stages implement only those two and a failing document never
+        aborts the batch. Stages that override ``execute`` need neither.
+        """
+        problem = self.check(context)
+        if problem is not None:
+            context.add_error(self.name, problem)
+            return context
+        try:
+            self.run(context)
+        except Exception as exc:
+            context.add_error(self.name, str(exc))
+        return context
+
+    def check(self, context: PipelineContext) -> Optional[str]:
+        """Return why the stage cannot run on ``context``, or None if it can."""
+        return None
+
+    def run(self, context: PipelineContext) -> None:
+        """Do the stage's work on ``context``; used by the default ``execute``."""
+        raise NotImplementedError(f"{type(self).__name__} must implement run() or override execute()")
+
+    def prepare(self, pdf_paths: List[str]) -> None:
+        """Optional hook run once per batch, before any file is processed."""
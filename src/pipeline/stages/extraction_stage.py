@@ -1,3 +1,5 @@
+from typing import Optional
+
 from src.features.metadata import MetadataExtractor
 
 from ..context import PipelineContext
@@ -10,12 +12,8 @@ class ExtractionStage(BasePipelineStage):
     def __init__(self, extractor: MetadataExtractor) -> None:
         self._extractor = extractor
 
-    def execute(self, context: PipelineContext) -> PipelineContext:
-        if context.anonymized_text is None:
-            context.add_error(self.name, "No anonymized text")
-            return context
-        try:
-            context.metadata = self._extractor.extract_all(context.anonymized_text)
-        except Exception as exc:
-            context.add_error(self.name, str(exc))
-        return context
+    def check(self, context: PipelineContext) -> Optional[str]:
+        return "No anonymized text" if context.anonymized_text is None else None
+
+    def run(self, context: PipelineContext) -> None:
+        context.metadata = self._extractor.extract_all(context.anonymized_text)
@@ -10,9 +10,5 @@ class OCRStage(BasePipelineStage):
     def __init__(self, engine: OCREngine) -> None:
         self._engine = engine
 
-    def execute(self, context: PipelineContext) -> PipelineContext:
-        try:
-            context.extracted_text = self._engine.extract_text(context.pdf_path)
-        except Exception as exc:
-            context.add_error(self.name, str(exc))
-        return context
+    def run(self, context: PipelineContext) -> None:
+        context.extracted_text = self._engine.extract_text(context.pdf_path)
@@ -1,36 +1,57 @@
+import logging
 import os
-from pathlib import Path
+from typing import List, Optional
 
+from src.core.exceptions import UUIDMappingException
 from src.features.anonymization import UUIDMappingService
 from src.features.output import PDFGenerator
 
-from ..context import PipelineContext
+from ..context import PipelineContext, file_stem
 from .base import BasePipelineStage
 
+logger = logging.getLogger("medical_report_etl.pipeline")
+
 
 class OutputStage(BasePipelineStage):
     name = "Output"
+    io_bound = True
 
     def __init__(self, pdf_generator: PDFGenerator, uuid_service: UUIDMappingService, output_dir: str) -> None:
         self._pdf_generator = pdf_generator
         self._uuid_service = uuid_service
         self._output_dir = output_dir
+        self._output_dir_ready = False
 
-    def execute(self, context: PipelineContext) -> PipelineContext:
-        if context.anonymized_text is None:
-            context.add_error(self.name, "No anonymized text")
-            return context
-
+    def prepare(self, pdf_paths: List[str]) -> None:
         try:
-            real_id = Path(context.pdf_path).stem
-            anon_id = self._uuid_service.get_or_create_uuid(real_id)
-            context.metadata["patient_id"] = anon_id
-
+            self._ensure_output_dir()
+        except OSError as exc:
+            # Each document retries and records the failure on its own context
+            logger.warning("Could not create output directory: %s", exc)
+        # Assign every anonymized ID up front in one locked write, so workers
+        # (which receive the service with its mapping) never touch the map file
+        try:
+            self._uuid_service.get_or_create_uuids(file_stem(path) for path in pdf_paths)
+        except (UUIDMappingException, OSError) as exc:
+            # Not fatal here: each document retries the lookup and records
+            # the failure on its own context
+            logger.warning("Could not pre-assign anonymized IDs: %s", exc)
+
+    def check(self, context: PipelineContext) -> Optional[str]:
+        return "No anonymized text" if context.anonymized_text is None else None
+
+    def run(self, context: PipelineContext) -> None:
+        self._ensure_output_dir()
+        anon_id = self._uuid_service.get_or_create_uuid(context.stem)
+        context.metadata["patient_id"] = anon_id
+
+        output_path = os.path.join(self._output_dir, f"{anon_id}.pdf")
+        self._pdf_generator.generate(context.anonymized_text, output_path)
+        context.anonymized_pdf_path = output_path
+
+    def _ensure_output_dir(self) -> None:
+        # Created once per batch (or per stage for run_single callers) rather
+        # than stat'ed again for every document
+        if not self._output_dir_ready:
             os.makedirs(self._output_dir, exist_ok=True)
-            output_path = os.path.join(self._output_dir, f"{anon_id}.pdf")
-            self._pdf_generator.generate(context.anonymized_text, output_path)
-            context.anonymized_pdf_path = output_path
-        except Exception as exc:
-            context.add_error(self.name, str(exc))
-
-        return context
+            self._output_dir_ready = True
@@ -0,0 +1,36 @@
+from typing import Optional
+
+from src.features.anonymization import AnonymizationConfig, PIIRedactor, RedactionValidator
+from src.features.metadata import MetadataExtractor
+
+from ..context import PipelineContext
+from .anonymization_stage import AnonymizationStage
+
+
+class TextAnalysisStage(AnonymizationStage):
+    """Redact, validate and extract metadata in one stage.
+
+    Equivalent to running ``AnonymizationStage`` then ``ExtractionStage``,
+    but the text is handed straight from the redactor to the extractor while
+    it is still hot instead of taking another trip through the pipeline.
+    Pattern compilation in ``prepare`` and the input check are inherited.
+    """
+
+    name = "TextAnalysis"
+
+    def __init__(
+        self,
+        redactor: PIIRedactor,
+        validator: RedactionValidator,
+        extractor: MetadataExtractor,
+        config: Optional[AnonymizationConfig] = None,
+    ) -> None:
+        super().__init__(redactor, validator, config)
+        self._extractor = extractor
+
+    def run(self, context: PipelineContext) -> None:
+        anonymized_text = self._redactor.redact(context.extracted_text)
+        context.anonymized_text = anonymized_text
+        if self._validate and not self._validator.validate(anonymized_text):
+            context.add_error(self.name, "Redaction validation failed")
+        context.metadata = self._extractor.extract_all(anonymized_text)
@@ -2,6 +2,8 @@ import os
 import sys
 import pickle
 import pytest
+from concurrent.futures import Future
+from unittest.mock import patch
 from pathlib import Path
 from fpdf import FPDF
 
@@ -69,6 +71,9 @@ class StubUUIDService:
         self._mapping[original_id] = uid
         return uid
 
+    def get_or_create_uuids(self, original_ids):
+        return {original_id: self.get_or_create_uuid(original_id) for original_id in original_ids}
+
 
 class StubPDFGenerator:
     """PDF generation stub that optionally writes a marker file."""
@@ -80,8 +85,9 @@ class StubPDFGenerator:
         self.calls.append((anonymized_text, output_path))
         if self._should_fail:
             raise RuntimeError("PDF generation failed")
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        Path(output_path).write_text("stub-pdf", encoding="utf-8")
+        # OutputStage creates the directory first, like the real generator expects
+        with open(output_path, "wb") as handle:
+            handle.write(b"stub-pdf")
 
 
 class StubSerializer:
@@ -93,10 +99,61 @@ class StubSerializer:
         self.calls.append((list(metadata_list), output_path))
 
 
+class ScriptedStage:
+    """Duck-typed pipeline stage that runs ``action(context)``.
+
+    Set ``io_bound`` to mark it as a trailing output stage for ``run_batch``.
+    """
+    def __init__(self, action=None, io_bound=False):
+        self._action = action
+        self.io_bound = io_bound
+
+    def execute(self, context):
+        if self._action is not None:
+            self._action(context)
+        return context
+
+
+class FakeExecutor:
+    """Synchronous executor: runs each task in-process on submit.
+
+    Drop-in ``executor_factory`` for ``run_batch_parallel`` so tests exercise
+    the parallel path without thread or process startup, and mocks stay
+    visible. The initializer runs under a patched ``os.environ`` so worker
+    env defaults do not leak into the test process.
+    """
+    def __init__(self, max_workers=None, initializer=None, initargs=()):
+        if initializer is not None:
+            with patch.dict(os.environ):
+                initializer(*initargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
 # ---------------------------------------------------------------------------
 #  Fixtures
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def _reset_shared_pipeline_components():
+    """Drop factory-shared components after each test so no memoized text carries over."""
+    yield
+    from src.pipeline import factory
+    factory.reset()
+
+
 @pytest.fixture
 def generate_test_pdf(tmp_path):
     """Fixture to generate a temporary PDF file with specified text."""
@@ -105,8 +162,8 @@ def generate_test_pdf(tmp_path):
         pdf = FPDF()
         pdf.add_page()
         pdf.set_font("Arial", size=12)
-        for line in content.split('\n'):
-            pdf.cell(200, 10, txt=line, ln=1, align='L')
+        # One multi_cell lays out every line, as PDFGenerator does
+        pdf.multi_cell(0, 10, content, align='L')
         pdf.output(str(pdf_path))
         return str(pdf_path)
     return _create_pdf
@@ -120,7 +177,7 @@ def temp_output_dir(tmp_path):
     return str(output_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_medical_text():
     """Realistic medical report text containing all extractable fields."""
     return (
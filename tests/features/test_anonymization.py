@@ -1,3 +1,6 @@
+import json
+import uuid
+
 import pytest
 from src.features.anonymization import (
     PIIPattern,
@@ -84,12 +87,117 @@ def test_uuid_corrupt_file_raises(tmp_path):
     """Corrupt JSON must raise UUIDMappingException, not silently reset."""
     from src.core.exceptions import UUIDMappingException
     mapping_path = tmp_path / "map.json"
-    mapping_path.write_text("{bad json", encoding="utf-8")
+    mapping_path.write_text("{bad json\n", encoding="utf-8")
 
     with pytest.raises(UUIDMappingException):
         UUIDMappingService(str(mapping_path))
 
 
+def test_uuid_mapping_appends_one_line_per_id(tmp_path):
+    mapping_path = tmp_path / "map.json"
+    service = UUIDMappingService(str(mapping_path))
+    first = service.get_or_create_uuid("patient_1")
+    second = service.get_or_create_uuid("patient_2")
+
+    lines = mapping_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [{"patient_1": first}, {"patient_2": second}]
+    assert UUIDMappingService(str(mapping_path)).get_or_create_uuid("patient_2") == second
+
+
+def test_uuid_mapping_compacts_legacy_snapshot(tmp_path):
+    mapping_path = tmp_path / "map.json"
+    mapping_path.write_text(json.dumps({"a": "uuid-a", "b": "uuid-b"}, indent=2), encoding="utf-8")
+
+    service = UUIDMappingService(str(mapping_path))
+    assert service.get_or_create_uuid("a") == "uuid-a"
+    new_id = service.get_or_create_uuid("c")
+
+    lines = mapping_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+    assert UUIDMappingService(str(mapping_path)).get_or_create_uuid("c") == new_id
+
+
+@pytest.mark.parametrize("legacy", [
+    "{}",
+    json.dumps({"a": "uuid-a"}, indent=2),
+    json.dumps({"a": "uuid-a"}, indent=2) + "\n",
+    json.dumps({"a": "uuid-a"}),
+])
+def test_uuid_mapping_compacts_small_legacy_snapshot(tmp_path, legacy):
+    mapping_path = tmp_path / "map.json"
+    mapping_path.write_text(legacy, encoding="utf-8")
+
+    new_id = UUIDMappingService(str(mapping_path)).get_or_create_uuid("new")
+
+    reloaded = UUIDMappingService(str(mapping_path))
+    assert reloaded.get_or_create_uuid("new") == new_id
+    assert all(json.loads(line) for line in mapping_path.read_text(encoding="utf-8").splitlines())
+    if "uuid-a" in legacy:
+        assert reloaded.get_or_create_uuid("a") == "uuid-a"
+
+
+def test_uuid_single_record_log_is_appended_not_rewritten(tmp_path):
+    mapping_path = tmp_path / "map.json"
+    service = UUIDMappingService(str(mapping_path))
+    first = service.get_or_create_uuid("a")
+
+    second = UUIDMappingService(str(mapping_path)).get_or_create_uuid("b")
+
+    lines = mapping_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [{"a": first}, {"b": second}]
+
+
+@pytest.mark.parametrize("torn", ['{"b": "uuid-', '{"b":"uuid-b"}'])
+def test_uuid_torn_append_is_dropped_and_compacted(tmp_path, caplog, torn):
+    mapping_path = tmp_path / "map.json"
+    mapping_path.write_text('{"a":"uuid-a"}\n' + torn, encoding="utf-8")
+
+    service = UUIDMappingService(str(mapping_path))
+    assert service.get_or_create_uuid("a") == "uuid-a"
+    new_id = service.get_or_create_uuid("c")
+
+    assert all(json.loads(line) for line in mapping_path.read_text(encoding="utf-8").splitlines())
+    assert UUIDMappingService(str(mapping_path)).get_or_create_uuid("c") == new_id
+    if torn.endswith("-"):
+        assert "torn record" in caplog.text
+
+
+def test_uuid_bulk_creation_matches_single_lookups(tmp_path):
+    mapping_path = tmp_path / "map.json"
+    service = UUIDMappingService(str(mapping_path))
+    existing = service.get_or_create_uuid("p0")
+
+    ids = service.get_or_create_uuids(["p0", "p1", "p2", "p1"])
+
+    assert ids["p0"] == existing
+    assert len({ids["p0"], ids["p1"], ids["p2"]}) == 3
+    assert all(uuid.UUID(value).version == 4 for value in ids.values())
+    assert len(mapping_path.read_text(encoding="utf-8").splitlines()) == 3
+    assert UUIDMappingService(str(mapping_path)).get_or_create_uuid("p2") == ids["p2"]
+
+
+def test_uuid_miss_skips_reparse_when_file_unchanged(tmp_path, monkeypatch):
+    service = UUIDMappingService(str(tmp_path / "map.json"))
+    service.get_or_create_uuid("p1")
+
+    def _fail(content):
+        raise AssertionError("mapping file reparsed")
+
+    monkeypatch.setattr(service, "_read_log", _fail)
+    assert service.get_or_create_uuid("p2")
+
+
+def test_uuid_miss_reloads_after_external_write(tmp_path):
+    path = str(tmp_path / "map.json")
+    svc1 = UUIDMappingService(path)
+    svc1.get_or_create_uuid("p1")
+    svc2 = UUIDMappingService(path)
+
+    created_elsewhere = svc1.get_or_create_uuid("p2")
+
+    assert svc2.get_or_create_uuid("p2") == created_elsewhere
+
+
 def test_uuid_different_inputs_different_ids(tmp_path):
     """Two different patients must never get the same UUID."""
     service = UUIDMappingService(str(tmp_path / "map.json"))
@@ -106,3 +214,83 @@ def test_registry_overwrite_replaces_pattern():
     patterns = registry.get_all()
     assert len(patterns) == 1
     assert patterns[0].replacement == "NEW"
+
+
+def test_redactor_single_pass_respects_priority():
+    """When two patterns match at the same position the higher priority wins."""
+    registry = PIIPatternRegistry()
+    registry.register(PIIPattern("generic", r"ID \w+", "[GENERIC]", priority=20))
+    registry.register(PIIPattern("specific", r"ID \d+", "[NUMERIC]", priority=10))
+
+    output = PIIRedactor(registry.get_all()).redact("ID 123 and ID abc")
+
+    assert output == "[NUMERIC] and [GENERIC]"
+
+
+def test_redactor_fused_and_sequential_paths_agree(monkeypatch):
+    from src.features.anonymization import redactor as redactor_module
+    from src.features.anonymization import validator as validator_module
+
+    patterns = build_default_registry().get_all()
+    text = "Patient Name: Jane Doe\nPatient ID: AB-12\nClinician: Dr Who\nNotes"
+    sequential = PIIRedactor(patterns).redact(text)
+
+    monkeypatch.setattr(redactor_module, "is_linear_time", lambda pattern: True)
+    monkeypatch.setattr(validator_module, "is_linear_time", lambda pattern: True)
+    fused = PIIRedactor(patterns).redact(text)
+
+    assert fused == sequential
+    assert RedactionValidator(patterns).validate(fused) is True
+    assert RedactionValidator(patterns).validate(text) is False
+
+
+def test_registry_build_combined_maps_groups_to_replacements():
+    combined, replacements = build_default_registry().build_combined()
+
+    match = combined.search("ref Patient ID: 991")
+    assert replacements[match.lastgroup] == "Patient ID: [ANONYMIZED]"
+
+
+def test_combined_pattern_is_compiled_once_per_pattern_set():
+    first, replacements = build_default_registry().build_combined()
+    replacements.clear()
+    second, again = build_default_registry().build_combined()
+
+    assert first is second
+    assert again
+
+
+def test_redactor_survives_pickle_after_use():
+    import pickle
+
+    redactor = PIIRedactor(build_default_registry().get_all())
+    redactor.redact("Patient Name: Jane Doe")
+
+    restored = pickle.loads(pickle.dumps(redactor))
+
+    assert restored.redact("Patient Name: Jane Doe") == "Patient Name: [ANONYMIZED]"
+
+
+def test_compile_prepares_patterns_without_redacting():
+    patterns = build_default_registry().get_all()
+    redactor = PIIRedactor(patterns)
+    validator = RedactionValidator(patterns)
+
+    redactor.compile()
+    validator.compile()
+
+    assert redactor._fused is not None and validator._fused is not None
+    assert not redactor._cache
+    assert redactor.redact("Patient ID: 42") == "Patient ID: [ANONYMIZED]"
+
+
+def test_redactor_cache_is_bounded_and_consistent():
+    redactor = PIIRedactor(build_default_registry().get_all(), cache_size=2)
+    texts = [f"Patient Name: Person {chr(65 + i)}" for i in range(3)]
+
+    first = [redactor.redact(text) for text in texts]
+    second = [redactor.redact(text) for text in texts]
+
+    assert first == second
+    assert len(redactor._cache) == 2
+    assert all("Person" not in value for value in redactor._cache.values())
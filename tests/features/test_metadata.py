@@ -46,3 +46,18 @@ def test_metadata_extractor_collects_fields():
     assert metadata["BMI"] == 28.0
     assert metadata["gestational_age"] == "24 weeks 3 days"
     assert "findings" in metadata
+
+
+def test_fused_scan_matches_individual_extractors(monkeypatch):
+    from src.features.metadata import extractor as extractor_module
+
+    monkeypatch.setattr(extractor_module, "_fusion_pays_off", lambda combined: True)
+    extractors = [GestationalAgeExtractor(), AgeExtractor(), BMIExtractor(), FindingsExtractor()]
+    fused = MetadataExtractor(extractors)
+    assert fused._combined is not None
+
+    text = "BMI: 31.5 Age: 40\nExamination Findings\nAge: 99 noted\nConclusion\nGA: 20 weeks 1 day"
+    expected = {
+        ext.field_name: ext.extract(text) for ext in extractors if ext.extract(text) is not None
+    }
+    assert fused.extract_all(text) == expected
@@ -1,16 +1,20 @@
+import os
+
+import pytesseract
 import pytest
 
 from src.core.exceptions import OCRException
 from src.features.ocr import OCRConfig, OCREngine
+from src.features.ocr.text_extractor import TextExtractor
 
 
 class _StubConverter:
     def __init__(self, images):
         self._images = images
-        self.last_dpi = None
+        self.dpis = []
 
-    def convert(self, pdf_path, dpi):
-        self.last_dpi = dpi
+    def convert_to_files(self, pdf_path, dpi, output_dir):
+        self.dpis.append(dpi)
         return self._images
 
 
@@ -24,72 +28,203 @@ class _StubExtractor:
         return self._outputs.pop(0)
 
 
-def test_ocr_engine_extracts_text(monkeypatch):
-    converter = _StubConverter(["img1", "img2"])
-    extractor = _StubExtractor(["page1", "page2"])
-
+def _patch_engine(monkeypatch, converter, extractor):
+    """Make OCREngine build its converter and extractor around the given stubs."""
     class _FakeConverter:
         def __init__(self, poppler_path):
-            self.poppler_path = poppler_path
+            pass
 
-        def convert(self, pdf_path, dpi):
-            return converter.convert(pdf_path, dpi)
+        def convert_to_files(self, pdf_path, dpi, output_dir):
+            return converter.convert_to_files(pdf_path, dpi, output_dir)
 
-    class _FakeExtractor:
+    class _FakeExtractor(TextExtractor):
         def __init__(self, tesseract_path, language):
-            self.tesseract_path = tesseract_path
-            self.language = language
+            pass
 
         def extract(self, image):
             return extractor.extract(image)
 
+        def _extract_listed(self, paths):
+            # Keep list mode away from a real Tesseract binary
+            return [self.extract(path) for path in paths]
+
     monkeypatch.setattr("src.features.ocr.engine.PDFConverter", _FakeConverter)
     monkeypatch.setattr("src.features.ocr.engine.TextExtractor", _FakeExtractor)
 
-    config = OCRConfig(
-        tesseract_path="/tmp/tesseract",
-        poppler_path="/tmp/poppler",
-        dpi=300,
-        language="eng",
-    )
-    engine = OCREngine(config)
+
+def _ocr_config(**overrides):
+    values = dict(tesseract_path="/tmp/tesseract", poppler_path="/tmp/poppler", dpi=300, language="eng")
+    values.update(overrides)
+    return OCRConfig(**values)
+
+
+def test_ocr_engine_extracts_text(monkeypatch):
+    converter = _StubConverter(["img1", "img2"])
+    extractor = _StubExtractor(["page1", "page2"])
+    _patch_engine(monkeypatch, converter, extractor)
+    engine = OCREngine(_ocr_config())
 
     text = engine.extract_text("report.pdf")
 
     assert text == "page1\npage2"
-    assert converter.last_dpi == 300
+    assert converter.dpis == [300]
     assert extractor.calls == ["img1", "img2"]
 
 
 def test_ocr_engine_raises_on_empty_text(monkeypatch):
+    _patch_engine(monkeypatch, _StubConverter(["img1"]), _StubExtractor([""]))
+    engine = OCREngine(_ocr_config())
+
+    with pytest.raises(OCRException):
+        engine.extract_text("report.pdf")
+
+
+def test_ocr_engine_retries_blank_output_at_fallback_dpi(monkeypatch):
     converter = _StubConverter(["img1"])
-    extractor = _StubExtractor([""])
+    _patch_engine(monkeypatch, converter, _StubExtractor([" \f", "fine print\f"]))
+    engine = OCREngine(_ocr_config(dpi=200, fallback_dpi=300))
 
-    class _FakeConverter:
+    assert engine.extract_text("report.pdf") == "fine print\f"
+    assert converter.dpis == [200, 300]
+
+
+def test_ocr_engine_concurrent_pages_keep_order(monkeypatch):
+    class _PageExtractor:
+        def extract(self, image):
+            return image.replace("img", "page")
+
+    _patch_engine(monkeypatch, _StubConverter(["img1", "img2", "img3"]), _PageExtractor())
+    engine = OCREngine(_ocr_config(concurrency=3))
+
+    assert engine.extract_text("report.pdf") == "page1\npage2\npage3"
+
+
+def test_text_extractor_batches_page_files_through_list_file(monkeypatch, tmp_path):
+    calls = []
+
+    def _fake_image_to_string(image, lang=None):
+        assert os.path.dirname(image) == str(tmp_path)
+        with open(image, encoding="utf-8") as listing:
+            paths = listing.read().splitlines()
+        calls.append(len(paths))
+        return "".join(f"text of {path}\f" for path in paths)
+
+    monkeypatch.setattr("pytesseract.image_to_string", _fake_image_to_string)
+    # TextExtractor sets the command globally; restore it after the test
+    monkeypatch.setattr("pytesseract.pytesseract.tesseract_cmd", "tesseract")
+    paths = [str(tmp_path / f"page-{index}.png") for index in range(120)]
+
+    texts = TextExtractor("/tmp/tesseract", "eng").extract_many(paths)
+
+    assert calls == [50, 50, 20]
+    assert texts == [f"text of {path}\f" for path in paths]
+
+
+def test_text_extractor_list_mode_falls_back_per_page(monkeypatch):
+    def _fake_image_to_string(image, lang=None):
+        if image.endswith(".txt"):
+            return "pages ran together\f"
+        return f"text of {image}\f"
+
+    monkeypatch.setattr("pytesseract.image_to_string", _fake_image_to_string)
+    monkeypatch.setattr("pytesseract.pytesseract.tesseract_cmd", "tesseract")
+
+    texts = TextExtractor("/tmp/tesseract", "eng").extract_many(["a.png", "b.png"])
+
+    assert texts == ["text of a.png\f", "text of b.png\f"]
+
+
+def test_text_extractor_logs_list_mode_failure(monkeypatch, tmp_path, caplog):
+    def _fake_image_to_string(image, lang=None):
+        if image.endswith(".txt"):
+            raise pytesseract.TesseractError(1, "list file rejected")
+        return f"text of {image}\f"
+
+    monkeypatch.setattr("pytesseract.image_to_string", _fake_image_to_string)
+    monkeypatch.setattr("pytesseract.pytesseract.tesseract_cmd", "tesseract")
+    paths = [str(tmp_path / "a.png"), str(tmp_path / "b.png")]
+
+    texts = TextExtractor("/tmp/tesseract", "eng").extract_many(paths)
+
+    assert texts == [f"text of {path}\f" for path in paths]
+    assert "list file rejected" in caplog.text
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cached_pdf_converter_reuses_rendered_pages(tmp_path):
+    from src.features.ocr.page_cache import CachedPDFConverter
+
+    class _RenderingConverter:
+        def __init__(self):
+            self.calls = []
+
+        def convert_to_files(self, pdf_path, dpi, output_dir):
+            self.calls.append(dpi)
+            paths = []
+            for index in range(2):
+                path = os.path.join(output_dir, "page-%d.png" % (index + 1))
+                with open(path, "wb") as handle:
+                    handle.write(b"page%d" % index)
+                paths.append(path)
+            return paths
+
+    pdf_path = tmp_path / "report.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 fake")
+    inner = _RenderingConverter()
+    converter = CachedPDFConverter(inner, str(tmp_path / "cache"))
+
+    first = converter.convert_to_files(str(pdf_path), 200, str(tmp_path))
+    second = converter.convert_to_files(str(pdf_path), 200, str(tmp_path))
+
+    assert inner.calls == [200]
+    assert first == second
+    assert [open(path, "rb").read() for path in second] == [b"page0", b"page1"]
+
+    converter.convert_to_files(str(pdf_path), 300, str(tmp_path))
+    assert inner.calls == [200, 300]
+
+
+def test_ocr_engine_prefers_text_layer(monkeypatch):
+    class _FakeTextLayer:
         def __init__(self, poppler_path):
-            self.poppler_path = poppler_path
+            pass
 
-        def convert(self, pdf_path, dpi):
-            return converter.convert(pdf_path, dpi)
+        def extract_pages(self, pdf_path):
+            return ["Embedded text layer", "Second page"]
 
-    class _FakeExtractor:
-        def __init__(self, tesseract_path, language):
-            self.tesseract_path = tesseract_path
-            self.language = language
+    class _FailingConverter:
+        def convert_to_files(self, pdf_path, dpi, output_dir):
+            raise AssertionError("OCR should be skipped")
 
-        def extract(self, image):
-            return extractor.extract(image)
+    _patch_engine(monkeypatch, _FailingConverter(), _StubExtractor([]))
+    monkeypatch.setattr("src.features.ocr.engine.TextLayerExtractor", _FakeTextLayer)
+    engine = OCREngine(_ocr_config(text_layer_min_chars=10))
 
-    monkeypatch.setattr("src.features.ocr.engine.PDFConverter", _FakeConverter)
-    monkeypatch.setattr("src.features.ocr.engine.TextExtractor", _FakeExtractor)
+    assert engine.extract_text("report.pdf") == "Embedded text layer\nSecond page"
 
-    config = OCRConfig(
-        tesseract_path="/tmp/tesseract",
-        poppler_path="/tmp/poppler",
-        dpi=300,
-        language="eng",
-    )
-    engine = OCREngine(config)
 
-    with pytest.raises(OCRException):
-        engine.extract_text("report.pdf")
+@pytest.mark.parametrize("pages", [
+    [],
+    ["A long first page of embedded text", "   "],
+    ["A long first page of embedded text", "x", "y", "z"],
+])
+def test_ocr_engine_ocrs_when_text_layer_is_sparse(monkeypatch, pages):
+    class _FakeTextLayer:
+        def __init__(self, poppler_path):
+            pass
+
+        def extract_pages(self, pdf_path):
+            return pages
+
+    _patch_engine(monkeypatch, _StubConverter(["img1"]), _StubExtractor(["ocr text"]))
+    monkeypatch.setattr("src.features.ocr.engine.TextLayerExtractor", _FakeTextLayer)
+    engine = OCREngine(_ocr_config(text_layer_min_chars=10))
+
+    assert engine.extract_text("report.pdf") == "ocr text"
+
+
+def test_text_layer_extractor_missing_binary_returns_empty():
+    from src.features.ocr.text_layer import TextLayerExtractor
+
+    assert TextLayerExtractor("/non/existent/poppler").extract("report.pdf") == ""
+    assert TextLayerExtractor("/non/existent/poppler").extract_pages("report.pdf") == []
@@ -80,3 +80,25 @@ def test_pdf_generator_empty_text(tmp_path):
     PDFGenerator().generate("", str(output_path))
     assert output_path.exists()
     assert output_path.stat().st_size > 0
+
+
+def test_json_serializer_columns_layout(tmp_path):
+    output_path = tmp_path / "columns.json"
+    JSONSerializer(layout="columns").serialize(
+        [
+            {"patient_id": "a", "age": 30, "findings": ["x"]},
+            {"patient_id": "b", "BMI": 22.5},
+        ],
+        str(output_path),
+    )
+
+    columns = json.loads(output_path.read_text(encoding="utf-8"))["dataResources"]
+    assert columns["patient_id"] == ["a", "b"]
+    assert columns["age"] == columns["demographic_age"] == [30, None]
+    assert columns["BMI"] == [None, 22.5]
+    assert columns["findings"] == columns["examination_findings"] == [["x"], []]
+
+
+def test_json_serializer_rejects_unknown_layout():
+    with pytest.raises(ValueError):
+        JSONSerializer(layout="parquet")
@@ -1,13 +1,13 @@
 """Integration tests for error handling during batch and parallel execution.
 
-Rewrites the original test to be clean and deterministic, using
-ThreadPoolExecutor mock for reliable testing of error aggregation logic.
+Rewrites the original test to be clean and deterministic, injecting a
+synchronous FakeExecutor for reliable testing of error aggregation logic.
 """
 
-import concurrent.futures
 from unittest.mock import Mock, patch
 
 from src.pipeline import ETLPipeline, PipelineContext
+from tests.conftest import FakeExecutor
 
 
 def _make_pipeline():
@@ -31,14 +31,13 @@ def test_parallel_worker_failure_isolated():
         ctx.metadata = {"id": "ok"}
         return ctx
 
-    with patch('concurrent.futures.ProcessPoolExecutor',
-               side_effect=concurrent.futures.ThreadPoolExecutor):
-        with patch.object(pipeline, 'run_single', side_effect=side_effect):
-            results = pipeline.run_batch_parallel(
-                ["good1.pdf", "bad.pdf", "good2.pdf"],
-                "out.json",
-                max_workers=2,
-            )
+    with patch.object(pipeline, 'run_single', side_effect=side_effect):
+        results = pipeline.run_batch_parallel(
+            ["good1.pdf", "bad.pdf", "good2.pdf"],
+            "out.json",
+            max_workers=2,
+            executor_factory=FakeExecutor,
+        )
 
     assert len(results) == 3
 
@@ -63,29 +62,32 @@ def test_stage_error_does_not_crash_batch():
     serializer = Mock()
     pipeline = ETLPipeline([error_stage], serializer)
 
-    with patch('concurrent.futures.ProcessPoolExecutor',
-               side_effect=concurrent.futures.ThreadPoolExecutor):
-        results = pipeline.run_batch_parallel(
-            ["a.pdf", "b.pdf"], "out.json", max_workers=2
-        )
+    results = pipeline.run_batch_parallel(
+        ["a.pdf", "b.pdf"],
+        "out.json",
+        max_workers=2,
+        executor_factory=FakeExecutor,
+    )
 
     assert len(results) == 2
     assert all(r.has_errors() for r in results)
 
 
 def test_all_workers_fail_no_metadata_serialized():
-    """When all workers fail, serializer should receive empty metadata."""
+    """When all workers fail, there is no metadata and the serializer is skipped."""
     pipeline, serializer = _make_pipeline()
 
     def always_fail(pdf_path):
         raise RuntimeError("crash")
 
-    with patch('concurrent.futures.ProcessPoolExecutor',
-               side_effect=concurrent.futures.ThreadPoolExecutor):
-        with patch.object(pipeline, 'run_single', side_effect=always_fail):
-            results = pipeline.run_batch_parallel(
-                ["a.pdf", "b.pdf"], "out.json", max_workers=2
-            )
+    with patch.object(pipeline, 'run_single', side_effect=always_fail):
+        results = pipeline.run_batch_parallel(
+            ["a.pdf", "b.pdf"],
+            "out.json",
+            max_workers=2,
+            executor_factory=FakeExecutor,
+        )
 
     assert len(results) == 2
     assert all(r.has_errors() for r in results)
+    serializer.serialize.assert_not_called()
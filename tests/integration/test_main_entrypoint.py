@@ -1,15 +1,9 @@
 """Tests for main.py entry point — verifies build_pipeline wiring and main() behavior."""
 
-import sys
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-ROOT = Path(__file__).resolve().parents[2]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
 from main import build_pipeline
 from src.core import Settings
 from src.pipeline import ETLPipeline
@@ -21,15 +15,28 @@ def test_build_pipeline_returns_etl_pipeline():
     assert isinstance(pipeline, ETLPipeline)
 
 
-def test_build_pipeline_has_four_stages():
+def test_build_pipeline_has_three_stages():
     settings = Settings.load()
     pipeline = build_pipeline(settings)
-    assert len(pipeline._stages) == 4
+    assert len(pipeline._stages) == 3
 
 
 def test_build_pipeline_stage_order():
-    """Stages must be in order: OCR → Anonymization → Extraction → Output."""
+    """Stages must be in order: OCR → TextAnalysis → Output."""
     settings = Settings.load()
     pipeline = build_pipeline(settings)
     stage_names = [s.name for s in pipeline._stages]
-    assert stage_names == ["OCR", "Anonymization", "Extraction", "Output"]
+    assert stage_names == ["OCR", "TextAnalysis", "Output"]
+
+
+def test_build_pipeline_shares_stateless_components():
+    from src.pipeline import factory
+
+    settings = Settings.load()
+    first = build_pipeline(settings)
+    second = build_pipeline(settings)
+    assert first._stages[1]._redactor is second._stages[1]._redactor
+
+    factory.reset()
+    third = build_pipeline(settings)
+    assert third._stages[1]._redactor is not first._stages[1]._redactor
@@ -17,6 +17,12 @@ def test_context_default_values():
     assert ctx.errors == []
 
 
+def test_context_computes_stem_once():
+    ctx = PipelineContext(pdf_path="reports/patient_07.v2.pdf")
+
+    assert ctx.stem == "patient_07.v2"
+
+
 def test_context_metadata_is_dict():
     ctx = PipelineContext(pdf_path="x.pdf")
     assert isinstance(ctx.metadata, dict)
@@ -66,3 +72,16 @@ def test_context_is_picklable():
     assert restored.anonymized_text == ctx.anonymized_text
     assert restored.metadata == ctx.metadata
     assert restored.errors == ctx.errors
+
+
+def test_context_pickle_omits_unset_fields():
+    ctx = PipelineContext(pdf_path="reports/early_error.pdf")
+    ctx.add_error("OCR", "failed")
+
+    assert set(ctx.__getstate__()) == {"pdf_path", "metadata", "errors"}
+
+    restored = pickle.loads(pickle.dumps(ctx))
+
+    assert restored == ctx
+    assert restored.extracted_text is None
+    assert restored.stem == "early_error"
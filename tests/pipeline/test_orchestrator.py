@@ -3,25 +3,22 @@
 Uses shared stubs from conftest.py.
 """
 
-from tests.conftest import StubSerializer
-from src.pipeline import ETLPipeline, PipelineContext
+import os
+import threading
+from unittest.mock import patch
 
+from tests.conftest import FakeExecutor, ScriptedStage, StubSerializer
+from src.pipeline import ETLPipeline, PipelineContext
 
-class _PassthroughStage:
-    """Stub stage that sets metadata and passes through."""
-    def __init__(self, metadata=None):
-        self._metadata = metadata or {}
 
-    def execute(self, context: PipelineContext) -> PipelineContext:
-        context.metadata.update(self._metadata)
-        return context
+def _passthrough(metadata=None):
+    """Stage that sets metadata and passes through."""
+    return ScriptedStage(lambda ctx: ctx.metadata.update(metadata or {}))
 
 
-class _ErrorStage:
-    """Stub stage that always adds an error."""
-    def execute(self, context: PipelineContext) -> PipelineContext:
-        context.add_error("ErrorStage", "deliberate failure")
-        return context
+def _failing():
+    """Stage that always adds an error."""
+    return ScriptedStage(lambda ctx: ctx.add_error("ErrorStage", "deliberate failure"))
 
 
 # ---------------------------------------------------------------------------
@@ -30,7 +27,7 @@ class _ErrorStage:
 
 def test_run_single_returns_context():
     serializer = StubSerializer()
-    pipeline = ETLPipeline([_PassthroughStage({"age": 30})], serializer)
+    pipeline = ETLPipeline([_passthrough({"age": 30})], serializer)
 
     ctx = pipeline.run_single("a.pdf")
 
@@ -45,7 +42,7 @@ def test_run_single_returns_context():
 
 def test_pipeline_runs_batch_and_serializes(tmp_path):
     serializer = StubSerializer()
-    pipeline = ETLPipeline([_PassthroughStage({"age": 30})], serializer)
+    pipeline = ETLPipeline([_passthrough({"age": 30})], serializer)
 
     results = pipeline.run_batch(["a.pdf"], str(tmp_path / "out.json"))
 
@@ -54,9 +51,21 @@ def test_pipeline_runs_batch_and_serializes(tmp_path):
     assert len(serializer.calls) == 1
 
 
+def test_run_batch_logs_throttled_progress(tmp_path, caplog):
+    serializer = StubSerializer()
+    pipeline = ETLPipeline([_passthrough()], serializer)
+
+    with caplog.at_level("INFO", logger="medical_report_etl.pipeline"):
+        pipeline.run_batch([f"{i}.pdf" for i in range(50)], str(tmp_path / "out.json"))
+
+    progress = [record.getMessage() for record in caplog.records]
+    assert progress[-1] == "Processed 50/50 files"
+    assert len(progress) < 50
+
+
 def test_run_batch_empty_list(tmp_path):
     serializer = StubSerializer()
-    pipeline = ETLPipeline([_PassthroughStage()], serializer)
+    pipeline = ETLPipeline([_passthrough()], serializer)
 
     results = pipeline.run_batch([], str(tmp_path / "out.json"))
 
@@ -66,43 +75,101 @@ def test_run_batch_empty_list(tmp_path):
 
 def test_run_batch_all_failures_skips_serialization(tmp_path):
     serializer = StubSerializer()
-    pipeline = ETLPipeline([_ErrorStage()], serializer)
+    pipeline = ETLPipeline([_failing()], serializer)
 
     results = pipeline.run_batch(["a.pdf", "b.pdf"], str(tmp_path / "out.json"))
 
     assert len(results) == 2
     assert all(r.has_errors() for r in results)
-    # Serializer should still be called, but with empty metadata list
-    if serializer.calls:
-        metadata_list = serializer.calls[0][0]
-        assert len(metadata_list) == 0
+    # Nothing to write, so the serializer is never called
+    assert serializer.calls == []
 
 
 def test_run_batch_stages_execute_in_order(tmp_path):
     """Context flows through stages in the declared order."""
     order = []
-
-    class _OrderTracker:
-        def __init__(self, tag):
-            self._tag = tag
-
-        def execute(self, ctx):
-            order.append(self._tag)
-            return ctx
+    stages = [ScriptedStage(lambda ctx, tag=tag: order.append(tag)) for tag in "ABC"]
 
     serializer = StubSerializer()
-    pipeline = ETLPipeline([_OrderTracker("A"), _OrderTracker("B"), _OrderTracker("C")], serializer)
+    pipeline = ETLPipeline(stages, serializer)
 
     pipeline.run_batch(["test.pdf"], str(tmp_path / "out.json"))
 
     assert order == ["A", "B", "C"]
 
 
+def test_run_batch_overlaps_trailing_io_stage(tmp_path):
+    """io_bound trailing stages run off the main thread; results keep input order."""
+    threads = []
+
+    def write(ctx):
+        threads.append(threading.current_thread())
+        ctx.metadata["written"] = ctx.pdf_path
+
+    serializer = StubSerializer()
+    pipeline = ETLPipeline([_passthrough({"age": 1}), ScriptedStage(write, io_bound=True)], serializer)
+
+    results = pipeline.run_batch(["a.pdf", "b.pdf", "c.pdf"], str(tmp_path / "out.json"))
+
+    assert [ctx.metadata["written"] for ctx in results] == ["a.pdf", "b.pdf", "c.pdf"]
+    assert threads and threading.main_thread() not in threads
+    assert len(serializer.calls[0][0]) == 3
+
+
 def test_serializer_receives_correct_output_path(tmp_path):
     serializer = StubSerializer()
-    pipeline = ETLPipeline([_PassthroughStage()], serializer)
+    pipeline = ETLPipeline([_passthrough()], serializer)
     out = str(tmp_path / "specific_output.json")
 
     pipeline.run_batch(["x.pdf"], out)
 
     assert serializer.calls[0][1] == out
+
+
+def test_worker_init_limits_tesseract_threads_unless_set():
+    from src.pipeline.orchestrator import _worker_init
+
+    with patch.dict(os.environ, clear=True):
+        _worker_init()
+        assert os.environ["OMP_THREAD_LIMIT"] == "1"
+        assert os.environ["OMP_NUM_THREADS"] == "1"
+        assert os.environ["OPENBLAS_NUM_THREADS"] == "1"
+
+    with patch.dict(os.environ, {"OMP_THREAD_LIMIT": "2"}):
+        _worker_init()
+        assert os.environ["OMP_THREAD_LIMIT"] == "2"
+
+
+# ---------------------------------------------------------------------------
+#  run_batch_parallel
+# ---------------------------------------------------------------------------
+
+def test_run_batch_parallel_with_fake_executor(tmp_path):
+    serializer = StubSerializer()
+    pipeline = ETLPipeline([_passthrough({"age": 30})], serializer)
+
+    results = pipeline.run_batch_parallel(
+        ["a.pdf", "b.pdf"],
+        str(tmp_path / "out.json"),
+        max_workers=2,
+        executor_factory=FakeExecutor,
+    )
+
+    assert sorted(r.pdf_path for r in results) == ["a.pdf", "b.pdf"]
+    assert all(r.metadata["age"] == 30 for r in results)
+    assert len(serializer.calls) == 1
+
+
+def test_run_batch_parallel_single_worker_skips_executor(tmp_path):
+    serializer = StubSerializer()
+    pipeline = ETLPipeline([_passthrough()], serializer)
+
+    def no_executor(*args, **kwargs):
+        raise AssertionError("executor should not be created")
+
+    results = pipeline.run_batch_parallel(
+        ["a.pdf"], str(tmp_path / "out.json"), max_workers=1, executor_factory=no_executor
+    )
+
+    assert [r.pdf_path for r in results] == ["a.pdf"]
+    assert len(serializer.calls) == 1
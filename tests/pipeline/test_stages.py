@@ -14,12 +14,21 @@ from tests.conftest import (
     StubUUIDService,
     StubPDFGenerator,
 )
+from src.features.anonymization import (
+    AnonymizationConfig,
+    PIIPattern,
+    PIIRedactor,
+    RedactionValidator,
+    build_default_registry,
+)
 from src.pipeline import (
     AnonymizationStage,
+    BasePipelineStage,
     ExtractionStage,
     OCRStage,
     OutputStage,
     PipelineContext,
+    TextAnalysisStage,
 )
 
 
@@ -73,6 +82,16 @@ def test_anonymization_stage_validation_failure():
     assert ctx.has_errors()
 
 
+def test_anonymization_stage_skips_validation_when_disabled():
+    stage = AnonymizationStage(
+        StubRedactor(), StubValidator(valid=False), AnonymizationConfig(enable_validation=False)
+    )
+    ctx = stage.execute(PipelineContext(pdf_path="file.pdf", extracted_text="raw"))
+
+    assert ctx.anonymized_text == "raw"
+    assert not ctx.has_errors()
+
+
 def test_anonymization_stage_exception_in_redactor():
     def blow_up(text):
         raise RuntimeError("redactor crash")
@@ -119,6 +138,68 @@ def test_extraction_stage_exception_in_extractor():
     assert ctx.has_errors()
 
 
+# ---------------------------------------------------------------------------
+#  Text Analysis Stage
+# ---------------------------------------------------------------------------
+
+def test_text_analysis_stage_happy_path():
+    stage = TextAnalysisStage(
+        StubRedactor(transform_fn=str.upper),
+        StubValidator(valid=True),
+        StubMetadataExtractor({"age": 30}),
+    )
+    ctx = PipelineContext(pdf_path="file.pdf", extracted_text="raw text")
+
+    ctx = stage.execute(ctx)
+
+    assert ctx.anonymized_text == "RAW TEXT"
+    assert ctx.metadata["age"] == 30
+    assert not ctx.has_errors()
+
+
+def test_text_analysis_stage_requires_text():
+    stage = TextAnalysisStage(StubRedactor(), StubValidator(), StubMetadataExtractor())
+    ctx = stage.execute(PipelineContext(pdf_path="file.pdf"))
+
+    assert ctx.has_errors()
+    assert ctx.anonymized_text is None
+
+
+def test_text_analysis_stage_validation_failure_still_extracts():
+    stage = TextAnalysisStage(
+        StubRedactor(), StubValidator(valid=False), StubMetadataExtractor({"age": 41})
+    )
+    ctx = stage.execute(PipelineContext(pdf_path="file.pdf", extracted_text="raw"))
+
+    assert ctx.has_errors()
+    assert ctx.metadata["age"] == 41
+
+
+def test_text_analysis_stage_prepare_compiles_patterns():
+    patterns = build_default_registry().get_all()
+    redactor, validator = PIIRedactor(patterns), RedactionValidator(patterns)
+    stage = TextAnalysisStage(
+        redactor, validator, StubMetadataExtractor(), AnonymizationConfig(enable_validation=False)
+    )
+
+    stage.prepare(["a.pdf"])
+
+    assert redactor._fused is not None
+    assert validator._fused is None
+
+
+def test_anonymization_stage_prepare_logs_invalid_pattern(caplog):
+    patterns = [PIIPattern(name="bad", regex="(unclosed", replacement="x")]
+    stage = AnonymizationStage(PIIRedactor(patterns), RedactionValidator(patterns))
+
+    with caplog.at_level("WARNING", logger="medical_report_etl.pipeline"):
+        stage.prepare(["a.pdf"])
+    ctx = stage.execute(PipelineContext(pdf_path="a.pdf", extracted_text="text"))
+
+    assert "Could not compile PII patterns" in caplog.text
+    assert ctx.has_errors()
+
+
 # ---------------------------------------------------------------------------
 #  Output Stage
 # ---------------------------------------------------------------------------
@@ -138,8 +219,103 @@ def test_output_stage_happy_path(tmp_path):
     assert len(gen.calls) == 1
 
 
+def test_output_stage_creates_output_dir_in_prepare_not_construction(tmp_path):
+    output_dir = tmp_path / "nested" / "out"
+    stage = OutputStage(StubPDFGenerator(), StubUUIDService(), str(output_dir))
+    assert not output_dir.exists()
+
+    stage.prepare(["a.pdf"])
+
+    assert output_dir.is_dir()
+
+
+def test_output_stage_creates_output_dir_when_run_alone(tmp_path):
+    output_dir = tmp_path / "nested" / "out"
+    stage = OutputStage(StubPDFGenerator(), StubUUIDService(), str(output_dir))
+
+    ctx = stage.execute(PipelineContext(pdf_path="file.pdf", anonymized_text="clean"))
+
+    assert not ctx.has_errors()
+    assert output_dir.is_dir()
+
+
 def test_output_stage_requires_text(tmp_path):
     stage = OutputStage(StubPDFGenerator(), StubUUIDService(), str(tmp_path))
     ctx = stage.execute(PipelineContext(pdf_path="file.pdf"))
 
     assert ctx.has_errors()
+
+
+def test_output_stage_prepare_assigns_ids_up_front(tmp_path):
+    uuid_svc = StubUUIDService()
+    stage = OutputStage(StubPDFGenerator(), uuid_svc, str(tmp_path))
+
+    stage.prepare(["dir/b.pdf", "dir/a.pdf"])
+    ctx = stage.execute(PipelineContext(pdf_path="dir/a.pdf", anonymized_text="clean"))
+
+    assert ctx.metadata["patient_id"] == "uuid-002"
+
+
+def test_output_stage_prepare_logs_mapping_failure(tmp_path, caplog):
+    from src.core.exceptions import UUIDMappingException
+
+    class _BrokenUUIDService(StubUUIDService):
+        def get_or_create_uuids(self, original_ids):
+            raise UUIDMappingException("map file is read-only")
+
+    stage = OutputStage(StubPDFGenerator(), _BrokenUUIDService(), str(tmp_path))
+
+    with caplog.at_level("WARNING", logger="medical_report_etl.pipeline"):
+        stage.prepare(["a.pdf"])
+
+    assert "map file is read-only" in caplog.text
+
+
+# ---------------------------------------------------------------------------
+#  Base stage template
+# ---------------------------------------------------------------------------
+
+class _RecordingStage(BasePipelineStage):
+    name = "Recording"
+
+    def __init__(self, problem=None, error=None):
+        self._problem = problem
+        self._error = error
+        self.ran = False
+
+    def check(self, context):
+        return self._problem
+
+    def run(self, context):
+        self.ran = True
+        if self._error is not None:
+            raise self._error
+
+
+def test_base_stage_skips_run_when_check_fails():
+    stage = _RecordingStage(problem="missing input")
+    ctx = stage.execute(PipelineContext(pdf_path="file.pdf"))
+
+    assert not stage.ran
+    assert ctx.errors == ["Recording: missing input"]
+
+
+def test_stage_overriding_only_execute_still_instantiates():
+    class _LegacyStage(BasePipelineStage):
+        name = "Legacy"
+
+        def execute(self, context):
+            context.metadata["legacy"] = True
+            return context
+
+    ctx = _LegacyStage().execute(PipelineContext(pdf_path="file.pdf"))
+
+    assert ctx.metadata == {"legacy": True}
+
+
+def test_base_stage_records_run_exception():
+    stage = _RecordingStage(error=RuntimeError("boom"))
+    ctx = stage.execute(PipelineContext(pdf_path="file.pdf"))
+
+    assert stage.ran
+    assert ctx.errors == ["Recording: boom"]
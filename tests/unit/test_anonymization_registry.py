@@ -1,3 +1,5 @@
+import pickle
+
 from src.features.anonymization.pii_patterns import (
     PIIPattern,
     PIIPatternRegistry,
@@ -11,6 +13,16 @@ def test_pii_pattern_creation():
     assert pattern.priority == 1
 
 
+def test_pii_pattern_compiles_once_and_pickles():
+    pattern = PIIPattern("test", r"ID\d+", "REPLACED")
+    assert pattern.compiled is pattern.compiled
+    assert pattern.compiled.search("see ID42")
+
+    restored = pickle.loads(pickle.dumps(pattern))
+    assert restored == pattern
+    assert restored.compiled.search("see ID42")
+
+
 def test_registry_registration_and_priority():
     registry = PIIPatternRegistry()
     p1 = PIIPattern("p1", "r1", "rep1", priority=10)
@@ -30,6 +42,16 @@ def test_registry_registration_and_priority():
     assert patterns[2].name == "p3"
 
 
+def test_registry_get_all_reflects_later_registrations():
+    registry = PIIPatternRegistry()
+    registry.register(PIIPattern("late", "r1", "rep1", priority=10))
+    registry.get_all().clear()
+
+    registry.register(PIIPattern("early", "r2", "rep2", priority=1))
+
+    assert [p.name for p in registry.get_all()] == ["early", "late"]
+
+
 def test_default_registry():
     registry = build_default_registry()
     patterns = registry.get_all()
@@ -37,3 +59,10 @@ def test_default_registry():
     names = [p.name for p in patterns]
     assert "patient_name" in names
     assert "patient_id" in names
+
+
+def test_default_registries_share_compiled_patterns():
+    first = build_default_registry().get_all()
+    second = build_default_registry().get_all()
+
+    assert all(a.compiled is b.compiled for a, b in zip(first, second))
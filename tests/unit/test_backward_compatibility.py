@@ -3,6 +3,12 @@ import warnings
 import pytest
 
 from src import anonymizer, extractor, json_writer, pdf_handler
+from src.core.utils import deprecation
+
+
+@pytest.fixture(autouse=True)
+def _fresh_deprecation_state(monkeypatch):
+    monkeypatch.setattr(deprecation, "_WARNED", set())
 
 
 def test_anonymize_text_warns():
@@ -56,3 +62,13 @@ def test_pdf_handler_facades(monkeypatch, tmp_path):
     assert text == "stub text"
     assert (tmp_path / "out.pdf").exists()
     assert any(item.category is DeprecationWarning for item in captured)
+
+
+def test_deprecation_warning_is_emitted_once():
+    with warnings.catch_warnings(record=True) as captured:
+        warnings.simplefilter("always")
+        anonymizer.anonymize_text("Patient Name: Jane Doe")
+        anonymizer.anonymize_text("Patient Name: John Roe")
+
+    assert [item.category for item in captured] == [DeprecationWarning]
+    assert captured[0].filename == __file__
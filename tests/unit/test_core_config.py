@@ -10,9 +10,15 @@ def test_settings_load_defaults():
     with patch.dict(os.environ, {}, clear=True):
         settings = Settings.load()
         assert settings.log_level == "INFO"
-        assert settings.ocr_dpi == 300
+        assert settings.ocr_dpi == 200
         assert settings.ocr_language == "eng"
         assert "tesseract" in settings.tesseract_path.lower()
+        assert settings.validate_redaction is True
+
+
+def test_settings_validate_redaction_can_be_disabled():
+    with patch.dict(os.environ, {"VALIDATE_REDACTION": "false"}, clear=True):
+        assert Settings.load().validate_redaction is False
 
 
 def test_settings_load_from_env():
@@ -46,6 +52,12 @@ def test_settings_max_workers_from_env():
         assert settings.max_workers == 4
 
 
+def test_settings_max_workers_defaults_to_cpu_count():
+    with patch.dict(os.environ, {}, clear=True), patch("os.cpu_count", return_value=6):
+        settings = Settings.load()
+        assert settings.max_workers == 6
+
+
 def test_settings_immutability():
     with patch.dict(os.environ, {}, clear=True):
         settings = Settings.load()
@@ -59,3 +71,15 @@ def test_default_paths_contain_data_dir():
         settings = Settings.load()
         assert "data" in settings.input_dir
         assert "data" in settings.output_dir
+
+
+def test_settings_ocr_concurrency_from_env():
+    with patch.dict(os.environ, {"OCR_CONCURRENCY": "3"}, clear=True):
+        settings = Settings.load()
+        assert settings.ocr_concurrency == 3
+
+
+def test_settings_ocr_concurrency_defaults_to_one_in_parallel_mode():
+    with patch.dict(os.environ, {"MAX_WORKERS": "4"}, clear=True):
+        settings = Settings.load()
+        assert settings.ocr_concurrency == 1
@@ -3,7 +3,7 @@ from src.core import Settings, configure_logging
 
 def test_settings_loads_defaults():
     settings = Settings.load()
-    assert settings.ocr_dpi == 300
+    assert settings.ocr_dpi == 200
     assert settings.input_dir
 
 
@@ -1,7 +1,10 @@
+import asyncio
 import json
+import re
 import pytest
 from unittest.mock import Mock, patch
-from src.core.utils.retry import retry_on_exception
+from src.core.utils.regex import compile_regex
+from src.core.utils.retry import retry_on_exception, retry_on_exception_async
 from src.core.utils.file_utils import ensure_directory, get_pdf_files, atomic_write_json, write_lines
 from src.core.utils.validation import validate_text_not_empty, validate_file_exists, validate_pdf
 
@@ -15,25 +18,58 @@ def test_retry_success():
 
 def test_retry_failure_then_success():
     mock_func = Mock(side_effect=[ValueError("Fail"), "Success"])
-    decorated = retry_on_exception(max_attempts=3)(mock_func)
-    
-    # Mock time.sleep to speed up test
-    with patch("time.sleep"):
-        result = decorated()
-    
+    sleeps = []
+    decorated = retry_on_exception(max_attempts=3, sleep_fn=sleeps.append)(mock_func)
+
+    result = decorated()
+
     assert result == "Success"
     assert mock_func.call_count == 2
+    assert sleeps == [1]
 
 
 def test_retry_max_attempts_exceeded():
     mock_func = Mock(side_effect=ValueError("Fail"))
-    decorated = retry_on_exception(max_attempts=2)(mock_func)
-    
-    with patch("time.sleep"):
+    decorated = retry_on_exception(max_attempts=2, sleep_fn=lambda _delay: None)(mock_func)
+
+    with pytest.raises(ValueError):
+        decorated()
+
+    assert mock_func.call_count == 2
+
+
+def test_retry_async_failure_then_success():
+    calls = []
+    sleeps = []
+
+    async def no_sleep(delay):
+        sleeps.append(delay)
+
+    @retry_on_exception_async(max_attempts=3, sleep_fn=no_sleep)
+    async def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise ValueError("Fail")
+        return "Success"
+
+    assert asyncio.run(flaky()) == "Success"
+
+    assert len(calls) == 2
+    assert sleeps == [1]
+
+
+def test_retry_backoff_is_capped_and_jittered():
+    sleeps = []
+    decorated = retry_on_exception(
+        max_attempts=5, initial_delay=1, max_delay=3, jitter=True, sleep_fn=sleeps.append
+    )(Mock(side_effect=ValueError("Fail")))
+
+    with patch("random.random", return_value=0.5):
         with pytest.raises(ValueError):
             decorated()
-    
-    assert mock_func.call_count == 2
+
+    # Uncapped waits 1, 2, 4, 8 become 1, 2, 3, 3, each scaled by 0.75
+    assert sleeps == [0.75, 1.5, 2.25, 2.25]
 
 
 def test_ensure_directory(tmp_path):
@@ -49,6 +85,9 @@ def test_validate_text_not_empty():
         validate_text_not_empty("")
     with pytest.raises(ValueError):
         validate_text_not_empty("   ")
+    with pytest.raises(ValueError):
+        validate_text_not_empty("\n\t\u00a0")
+    validate_text_not_empty("  \n x ")
 
 
 def test_get_pdf_files(tmp_path):
@@ -62,6 +101,13 @@ def test_get_pdf_files(tmp_path):
     assert any("b.PDF" in p for p in pdfs)
 
 
+def test_get_pdf_files_skips_directories(tmp_path):
+    (tmp_path / "folder.pdf").mkdir()
+    (tmp_path / "a.pdf").touch()
+
+    assert get_pdf_files(str(tmp_path)) == [str(tmp_path / "a.pdf")]
+
+
 def test_atomic_write_json_creates_valid_json(tmp_path):
     output = tmp_path / "data.json"
     payload = {"key": "value", "nested": [1, 2, 3]}
@@ -84,6 +130,42 @@ def test_atomic_write_json_replaces_existing(tmp_path):
     assert "old" not in loaded
 
 
+def test_atomic_write_json_without_orjson(tmp_path, monkeypatch):
+    from src.core.utils import file_utils
+
+    monkeypatch.setattr(file_utils, "orjson", None)
+    output = tmp_path / "data.json"
+    payload = {"name": "Zoë", "values": [1.5, None]}
+
+    atomic_write_json(str(output), payload)
+
+    assert json.loads(output.read_text(encoding="utf-8")) == payload
+
+
+@pytest.mark.parametrize("accelerated", [True, False])
+def test_json_helpers_round_trip(monkeypatch, accelerated):
+    from src.core.utils import file_utils
+
+    if not accelerated:
+        monkeypatch.setattr(file_utils, "orjson", None)
+    payload = {"id": "Zoë", "values": [1, None]}
+
+    assert file_utils.loads_json(file_utils.dumps_json(payload)) == payload
+    with pytest.raises(ValueError):
+        file_utils.loads_json(b"{bad json")
+
+
+def test_atomic_write_json_compact_unless_pretty(tmp_path):
+    output = tmp_path / "data.json"
+    payload = {"key": "value", "nested": [1, 2]}
+
+    atomic_write_json(str(output), payload)
+    assert output.read_text(encoding="utf-8") == '{"key":"value","nested":[1,2]}'
+
+    atomic_write_json(str(output), payload, pretty=True)
+    assert "\n  " in output.read_text(encoding="utf-8")
+
+
 def test_atomic_write_no_temp_file_left(tmp_path):
     output = tmp_path / "data.json"
     atomic_write_json(str(output), {"k": "v"})
@@ -100,6 +182,16 @@ def test_write_lines_creates_file(tmp_path):
     assert content == "line1\nline2\nline3\n"
 
 
+def test_write_lines_accepts_generator_and_empty_input(tmp_path):
+    output = tmp_path / "lines.txt"
+
+    write_lines(str(output), (f"row{i}" for i in range(2)))
+    assert output.read_text(encoding="utf-8") == "row0\nrow1\n"
+
+    write_lines(str(output), [])
+    assert output.read_text(encoding="utf-8") == ""
+
+
 def test_validate_file_exists_raises_for_missing():
     with pytest.raises(FileNotFoundError):
         validate_file_exists("/non/existent/file.pdf")
@@ -116,8 +208,37 @@ def test_validate_pdf_rejects_non_pdf():
         validate_pdf("report.docx")
     with pytest.raises(ValueError):
         validate_pdf("image.png")
+    with pytest.raises(ValueError):
+        validate_pdf("pdf")
 
 
 def test_validate_pdf_accepts_pdf():
     validate_pdf("report.pdf")
     validate_pdf("REPORT.PDF")
+    validate_pdf("scans/Report.Pdf")
+
+
+def test_compile_regex_honours_flags():
+    pattern = compile_regex(r"age:\s*(\d+)", re.IGNORECASE)
+    assert pattern.search("AGE: 42").group(1) == "42"
+
+
+def test_compile_regex_supports_lookarounds():
+    pattern = compile_regex(r"Findings(?=\s*Conclusion)")
+    assert pattern.search("Findings Conclusion")
+    assert pattern.search("Findings only") is None
+
+
+def test_atomic_write_bytes_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    from src.core.utils import file_utils
+
+    def fail_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(file_utils.os, "fsync", fail_fsync)
+    output = tmp_path / "data.json"
+
+    with pytest.raises(OSError):
+        file_utils.atomic_write_bytes(str(output), b"{}")
+
+    assert list(tmp_path.iterdir()) == []
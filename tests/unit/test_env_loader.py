@@ -47,6 +47,18 @@ def test_lines_without_equals_skipped(tmp_path):
     assert result == {"GOOD": "value", "ALSO_GOOD": "yes"}
 
 
+def test_reloads_after_file_changes(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("KEY=one\n")
+    first = load_env_file(str(env_file))
+    first["KEY"] = "mutated"
+
+    assert load_env_file(str(env_file)) == {"KEY": "one"}
+
+    env_file.write_text("KEY=two\nOTHER=x\n")
+    assert load_env_file(str(env_file)) == {"KEY": "two", "OTHER": "x"}
+
+
 def test_apply_env_sets_only_missing():
     with patch.dict(os.environ, {}, clear=True):
         apply_env({"NEW_VAR": "new_value"})
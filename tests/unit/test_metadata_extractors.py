@@ -37,6 +37,18 @@ class TestAgeExtractor:
     def test_no_match_returns_none(self):
         assert self.ext.extract("No age info here") is None
 
+    @pytest.mark.parametrize("text,expected", [
+        ("Age: 120", 120), ("Age: 7 years", 7), ("Age: 121", None), ("Age: 999", None),
+    ])
+    def test_pattern_bounds_range(self, text, expected):
+        assert self.ext.extract(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Age: 30y", 30), ("Age: 32yrs", 32), ("Age:45years", 45), ("Age: 130y", None),
+    ])
+    def test_unit_suffix_still_matches(self, text, expected):
+        assert self.ext.extract(text) == expected
+
     def test_field_name(self):
         assert self.ext.field_name == "age"
 
@@ -74,6 +86,18 @@ class TestBMIExtractor:
     def test_no_match_returns_none(self):
         assert self.ext.extract("No BMI data") is None
 
+    def test_pattern_rejects_three_digit_values(self):
+        assert self.ext.extract("BMI: 250") is None
+        assert self.ext.extract("BMI: 25.") == 25.0
+
+    @pytest.mark.parametrize("text,expected", [
+        ("BMI: 23.5kg/m2", 23.5), ("BMI: 23.5 kg/m2", 23.5), ("BMI: 28kg/m2", 28.0),
+        ("BMI: 123.4", None), ("BMI: 100.0", 100.0), ("BMI: 100", 100.0),
+        ("BMI: 100.5", None),
+    ])
+    def test_unit_suffix_keeps_full_value(self, text, expected):
+        assert self.ext.extract(text) == expected
+
     def test_field_name(self):
         assert self.ext.field_name == "BMI"
 
@@ -148,6 +172,18 @@ class TestFindingsExtractor:
         result = self.ext.extract(text)
         assert result is None
 
+    def test_missing_conclusion_returns_none(self):
+        text = "Examination Findings\nHead : Normal\n" * 500
+        assert self.ext.extract(text) is None
+
+    def test_windows_line_endings(self):
+        text = "Examination Findings\r\nHead : Normal\r\n\r\nBrain : Clear\r\nConclusion"
+        assert self.ext.extract(text) == ["Head : Normal", "Brain : Clear"]
+
+    def test_markers_are_case_insensitive(self):
+        text = "EXAMINATION FINDINGS\nHead : Normal\nconclusion"
+        assert self.ext.extract(text) == ["Head : Normal"]
+
     def test_field_name(self):
         assert self.ext.field_name == "findings"
 
@@ -173,7 +209,7 @@ class TestMetadataExtractor:
 
     def test_skips_invalid_values(self):
         """Values failing validate() should be excluded."""
-        # Age of 999 will extract but fail validation (> 120)
+        # Age of 999 is out of range, so it is never extracted
         ext = MetadataExtractor([AgeExtractor()])
         result = ext.extract_all("Age: 999")
         assert "age" not in result
@@ -202,6 +238,44 @@ class TestMetadataExtractor:
         with pytest.raises(ExtractionException):
             ext.extract_all("any text")
 
+    def test_repeated_text_is_served_from_cache(self):
+        class _CountingExtractor(AgeExtractor):
+            calls = 0
+
+            def parse(self, match):
+                type(self).calls += 1
+                return super().parse(match)
+
+        ext = MetadataExtractor([_CountingExtractor()], cache_size=1)
+        first = ext.extract_all("Age: 40")
+        first["age"] = 0
+
+        assert ext.extract_all("Age: 40") == {"age": 40}
+        assert _CountingExtractor.calls == 1
+        ext.extract_all("Age: 41")
+        ext.extract_all("Age: 40")
+        assert _CountingExtractor.calls == 3
+
+    def test_mutating_cached_findings_does_not_leak(self):
+        ext = MetadataExtractor([FindingsExtractor()])
+        text = "Examination Findings\nHead : Normal\nConclusion"
+
+        first = ext.extract_all(text)
+        expected = list(first["findings"])
+        first["findings"].append("tampered")
+        second = ext.extract_all(text)
+        second["findings"].clear()
+
+        assert ext.extract_all(text)["findings"] == expected
+
+    @pytest.mark.parametrize("extractor_cls", [
+        AgeExtractor, BMIExtractor, GestationalAgeExtractor, FindingsExtractor,
+    ])
+    def test_patterns_avoid_lookarounds(self, extractor_cls):
+        # RE2 rejects lookarounds; one such pattern silently disables the fused scan
+        pattern = extractor_cls.pattern.pattern
+        assert not any(token in pattern for token in ("(?=", "(?!", "(?<=", "(?<!"))
+
 
 # ---------------------------------------------------------------------------
 #  Standalone validators
@@ -2,6 +2,13 @@ import jsonschema
 import pytest
 from src.features.metadata.schema import METADATA_SCHEMA
 
+# Checked and built once; jsonschema.validate would redo both per call
+_VALIDATOR = jsonschema.Draft7Validator(METADATA_SCHEMA)
+
+
+def test_schema_is_valid_draft7():
+    jsonschema.Draft7Validator.check_schema(METADATA_SCHEMA)
+
 
 def test_schema_valid_data():
     valid_data = {
@@ -11,7 +18,7 @@ def test_schema_valid_data():
         "BMI": 25.5,
         "findings": ["Normal content"],
     }
-    jsonschema.validate(instance=valid_data, schema=METADATA_SCHEMA)
+    _VALIDATOR.validate(valid_data)
 
 
 def test_schema_missing_required():
@@ -19,7 +26,7 @@ def test_schema_missing_required():
         "age": 30
     }
     with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=invalid_data, schema=METADATA_SCHEMA)
+        _VALIDATOR.validate(invalid_data)
 
 
 def test_schema_invalid_types():
@@ -27,4 +34,4 @@ def test_schema_invalid_types():
         "patient_id": 12345,  # Should be string
     }
     with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=invalid_data, schema=METADATA_SCHEMA)
+        _VALIDATOR.validate(invalid_data)
@@ -16,48 +16,48 @@ from src.features.anonymization import (
 )
 
 
-@pytest.fixture
+# Module-scoped: tests only call redact/validate, which never change results
+@pytest.fixture(scope="module")
 def default_redactor():
     registry = build_default_registry()
     return PIIRedactor(registry.get_all())
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_validator():
     registry = build_default_registry()
     return RedactionValidator(registry.get_all())
 
 
+@pytest.fixture(scope="module")
+def redacted_text(default_redactor, sample_medical_text):
+    """The sample report redacted once, shared by the completeness checks."""
+    return default_redactor.redact(sample_medical_text)
+
+
 class TestRedactionCompleteness:
     """Verify all 4 PII fields are removed from realistic medical text."""
 
-    def test_patient_name_redacted(self, default_redactor, sample_medical_text):
-        result = default_redactor.redact(sample_medical_text)
-        assert "Jane Doe" not in result
-        assert "[ANONYMIZED]" in result
+    def test_patient_name_redacted(self, redacted_text):
+        assert "Jane Doe" not in redacted_text
+        assert "[ANONYMIZED]" in redacted_text
 
-    def test_patient_id_redacted(self, default_redactor, sample_medical_text):
-        result = default_redactor.redact(sample_medical_text)
-        assert "PAT-12345" not in result
+    def test_patient_id_redacted(self, redacted_text):
+        assert "PAT-12345" not in redacted_text
 
-    def test_hospital_name_redacted(self, default_redactor, sample_medical_text):
-        result = default_redactor.redact(sample_medical_text)
-        assert "City General Hospital" not in result
+    def test_hospital_name_redacted(self, redacted_text):
+        assert "City General Hospital" not in redacted_text
 
-    def test_clinician_redacted(self, default_redactor, sample_medical_text):
-        result = default_redactor.redact(sample_medical_text)
-        assert "Dr. Smith" not in result
+    def test_clinician_redacted(self, redacted_text):
+        assert "Dr. Smith" not in redacted_text
 
-    def test_all_four_fields_redacted(self, default_redactor, default_validator,
-                                       sample_medical_text):
-        redacted = default_redactor.redact(sample_medical_text)
-        assert default_validator.validate(redacted) is True
+    def test_all_four_fields_redacted(self, default_validator, redacted_text):
+        assert default_validator.validate(redacted_text) is True
 
-    def test_non_pii_fields_preserved(self, default_redactor, sample_medical_text):
-        result = default_redactor.redact(sample_medical_text)
+    def test_non_pii_fields_preserved(self, redacted_text):
         # Clinical data must survive redaction
-        assert "Age:" in result or "age" in result.lower()
-        assert "BMI:" in result or "bmi" in result.lower()
+        assert "Age:" in redacted_text or "age" in redacted_text.lower()
+        assert "BMI:" in redacted_text or "bmi" in redacted_text.lower()
 
 
 class TestRedactorEdgeCases: